@@ -24,8 +24,13 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# Resolved once; main() runs per job when the script is a daemon worker
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_CONFIG_PATH = SCRIPT_DIR / "config.yaml"
+LOG_FILE = SCRIPT_DIR / "censor_video.log"
+
 # Add parent to path for development
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(SCRIPT_DIR))
 
 from video_censor.config import Config
 from video_censor.validator import validate_input, validate_output_path, VideoInfo
@@ -56,8 +61,8 @@ from video_censor.subtitles.parser import parse_srt
 logger = logging.getLogger(__name__)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Parse command line arguments (sys.argv[1:] when argv is None)."""
     parser = argparse.ArgumentParser(
         description="Censor profanity and nudity from video files (fully offline)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -201,7 +206,7 @@ Examples:
         help="Path to SRT subtitle file to skip transcription"
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 
@@ -218,14 +223,12 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     
     # Configure logging with both file and console handlers
     # Use absolute path for log file to satisfy permissions
-    log_file = Path(__file__).parent / "censor_video.log"
-    
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler(str(log_file), mode='a')
+            logging.FileHandler(str(LOG_FILE), mode='a')
         ],
         datefmt='%H:%M:%S'
     )
@@ -953,9 +956,9 @@ def process_video(
             logger.warning(f"Failed to cleanup temp dir: {e}")
 
 
-def main() -> int:
+def main(argv: Optional[list] = None) -> int:
     """Main entry point."""
-    args = parse_args()
+    args = parse_args(argv)
     
     # Setup logging
     setup_logging(verbose=args.verbose, quiet=args.quiet)
@@ -971,9 +974,8 @@ def main() -> int:
     config_path = args.config
     if config_path is None:
         # Look for config in default locations
-        default_config = Path(__file__).parent / "config.yaml"
-        if default_config.exists():
-            config_path = default_config
+        if DEFAULT_CONFIG_PATH.exists():
+            config_path = DEFAULT_CONFIG_PATH
     
     config = Config.load(config_path)
     
@@ -1073,5 +1075,41 @@ def main() -> int:
         return 1
 
 
+# Written after every daemon job, followed by the job's exit code. It starts
+# with an ASCII record separator, which normal output never contains, so
+# the GUI finds it even when it lands mid-line after a tqdm bar
+DAEMON_JOB_DONE = "\x1eJOB_DONE"
+
+
+def run_daemon() -> int:
+    """
+    Serve censor jobs from stdin in a single long-lived process.
+    
+    Each input line is a JSON list of command line arguments, exactly as
+    they would be passed to main(). Output is streamed to stdout as usual
+    and each job ends with DAEMON_JOB_DONE and its exit code. This lets the GUI
+    pay interpreter start-up and heavy imports once, not once per video.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            code = main(json.loads(line))
+        except SystemExit as e:
+            # argparse exits on bad arguments; report it as a failed job
+            code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            logger.exception("Daemon job failed")
+            code = 1
+        
+        print(f"{DAEMON_JOB_DONE} {code}", flush=True)
+    
+    return 0
+
+
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--daemon"]:
+        sys.exit(run_daemon())
     sys.exit(main())
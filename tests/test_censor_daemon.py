@@ -0,0 +1,105 @@
+"""
+Tests for the persistent censor worker used by the processing queue.
+
+A tiny stand-in script speaks the same stdin/stdout protocol as
+`censor_video.py --daemon`, so no video tooling is needed.
+"""
+
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from ui.censor_daemon import CensorDaemon
+
+
+FAKE_DAEMON = textwrap.dedent("""
+    import json, os, subprocess, sys, time
+    assert sys.argv[1:] == ["--daemon"]
+    for line in sys.stdin:
+        args = json.loads(line)
+        if args == ["crash"]:
+            sys.exit(3)
+        if args == ["hang"]:
+            # Like a stuck ffmpeg: a grandchild keeps stdout open
+            subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+            print("hanging", flush=True)
+            time.sleep(10)
+        if args == ["chatty"]:
+            for i in range(20000):
+                print("línea", i)
+        if args == ["no-newline"]:
+            # A tqdm-style bar leaves the cursor mid-line
+            sys.stdout.write("progress 100%\\r")
+            print("\\x1eJOB_DONE", 0, flush=True)
+            continue
+        print("pid", os.getpid(), flush=True)
+        print("args", " ".join(args), flush=True)
+        print("\\x1eJOB_DONE", 0 if args[0] != "fail" else 1, flush=True)
+""")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    script = tmp_path / "fake_daemon.py"
+    script.write_text(FAKE_DAEMON)
+    d = CensorDaemon([sys.executable, "-u", str(script)])
+    yield d
+    d.stop()
+
+
+def _run(daemon, args):
+    daemon.start_job(args)
+    return [line.strip() for line in daemon.iter_output()]
+
+
+class TestCensorDaemon:
+    def test_job_output_and_exit_code(self, daemon):
+        lines = _run(daemon, ["in.mp4", "out.mp4"])
+        assert lines[-1] == "args in.mp4 out.mp4"
+        assert daemon.returncode == 0
+
+        _run(daemon, ["fail"])
+        assert daemon.returncode == 1
+
+    def test_process_is_reused_between_jobs(self, daemon):
+        first = _run(daemon, ["a"])[0]
+        second = _run(daemon, ["b"])[0]
+        assert first == second
+
+    def test_restarts_after_worker_exits(self, daemon):
+        _run(daemon, ["crash"])
+        assert daemon.returncode == 3
+
+        lines = _run(daemon, ["again"])
+        assert lines[-1] == "args again"
+        assert daemon.returncode == 0
+
+    def test_chatty_output_split_into_lines(self, daemon):
+        lines = _run(daemon, ["chatty"])
+        assert lines[:20000] == [f"línea {i}" for i in range(20000)]
+        assert daemon.returncode == 0
+
+    def test_marker_after_output_without_newline(self, daemon):
+        lines = _run(daemon, ["no-newline"])
+        assert lines == ["progress 100%"]
+        assert daemon.returncode == 0
+
+        assert _run(daemon, ["next"])[-1] == "args next"
+        assert daemon.returncode == 0
+
+    def test_cancel_stops_hung_job(self, daemon):
+        daemon.start_job(["hang"])
+        output = daemon.iter_output()
+        assert next(output).strip() == "hanging"
+
+        threading.Timer(0.2, daemon.cancel).start()
+        started = time.monotonic()
+        assert list(output) == []
+        assert time.monotonic() - started < 5
+        assert daemon.returncode != 0
+
+        assert _run(daemon, ["after"])[-1] == "args after"
+        assert daemon.returncode == 0
@@ -4,6 +4,8 @@ Unit tests for configuration loading.
 
 import pytest
 import tempfile
+import threading
+import yaml
 from pathlib import Path
 
 from video_censor.config import (
@@ -12,7 +14,8 @@ from video_censor.config import (
     NudityConfig,
     WhisperConfig,
     OutputConfig,
-    LoggingConfig
+    LoggingConfig,
+    write_config_text,
 )
 
 
@@ -223,3 +226,50 @@ class TestConfigNoPath:
         assert config.profanity.censor_mode == "beep"
         assert config.nudity.threshold == 0.6  # Precision nudity default
         assert config.whisper.model_size == "base"
+
+
+class TestConfigSave:
+    """Test writing configuration back to disk."""
+    
+    def test_save_round_trip(self, tmp_path):
+        """Saved values load back and no temp file is left behind."""
+        config_path = tmp_path / "config.yaml"
+        config = Config()
+        config.profanity.censor_mode = "mute"
+        config.output.custom_output_dir = "/videos/out"
+        config.save(config_path)
+        
+        loaded = Config.load(config_path)
+        assert loaded.profanity.censor_mode == "mute"
+        assert loaded.output.custom_output_dir == "/videos/out"
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+    
+    def test_to_yaml_excludes_internal_path(self, tmp_path):
+        config = Config()
+        config.save(tmp_path / "config.yaml")
+        data = yaml.safe_load(config.to_yaml())
+        assert "_path" not in data
+        assert data["profanity"]["censor_mode"] == "beep"
+    
+    def test_concurrent_writes_use_separate_temp_files(self, tmp_path):
+        """Overlapping writers each land a complete file."""
+        config_path = tmp_path / "config.yaml"
+        texts = [Config().to_yaml(), "profanity:\n  censor_mode: mute\n" * 200]
+        errors = []
+        
+        def writer(text):
+            for _ in range(50):
+                try:
+                    write_config_text(config_path, text)
+                except Exception as e:
+                    errors.append(e)
+        
+        threads = [threading.Thread(target=writer, args=(t,)) for t in texts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert errors == []
+        assert config_path.read_text() in texts
+        assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
@@ -0,0 +1,54 @@
+"""
+Tests for video_censor/profile_manager.py
+
+Tests profile CRUD against a temporary profiles file and the cached
+profile-name list.
+"""
+
+import pytest
+
+from video_censor.preferences import Profile, ContentFilterSettings
+from video_censor.profile_manager import ProfileManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProfileManager, "APP_DIR", tmp_path)
+    monkeypatch.setattr(ProfileManager, "PROFILES_FILE", tmp_path / "profiles.json")
+    return ProfileManager()
+
+
+class TestListNamesCache:
+    def test_default_first(self, manager):
+        assert manager.list_names()[0] == "Default"
+
+    def test_repeated_calls_return_cached_tuple(self, manager):
+        assert manager.list_names() is manager.list_names()
+
+    def test_add_invalidates(self, manager):
+        manager.add(Profile(name="Zed", settings=ContentFilterSettings()))
+        assert "Zed" in manager.list_names()
+
+    def test_rename_invalidates(self, manager):
+        manager.add(Profile(name="Old", settings=ContentFilterSettings()))
+        manager.list_names()
+        manager.update("Old", Profile(name="New", settings=ContentFilterSettings()))
+        names = manager.list_names()
+        assert "New" in names
+        assert "Old" not in names
+
+    def test_delete_invalidates(self, manager):
+        manager.add(Profile(name="Temp", settings=ContentFilterSettings()))
+        manager.list_names()
+        manager.delete("Temp")
+        assert "Temp" not in manager.list_names()
+
+    def test_duplicate_invalidates(self, manager):
+        manager.list_names()
+        manager.duplicate("Default", "Default Copy")
+        assert "Default Copy" in manager.list_names()
+
+    def test_reload_from_disk(self, manager):
+        manager.add(Profile(name="Saved", settings=ContentFilterSettings()))
+        manager.load()
+        assert "Saved" in manager.list_names()
@@ -0,0 +1,29 @@
+"""
+Tests for video_censor/video_info.py formatting helpers.
+"""
+
+import pytest
+
+from video_censor.video_info import _format_duration, _format_size
+
+
+class TestFormatSize:
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024 ** 2 - 1, "1024.0 KB"),
+        (1024 ** 2, "1.0 MB"),
+        (int(4.7 * 1024 ** 3), "4.7 GB"),
+        (3 * 1024 ** 4, "3.0 TB"),
+        (2000 * 1024 ** 5, "2000.0 PB"),
+    ])
+    def test_unit_boundaries(self, size, expected):
+        assert _format_size(size) == expected
+
+
+class TestFormatDuration:
+    def test_minutes_and_hours(self):
+        assert _format_duration(75) == "1:15"
+        assert _format_duration(3725) == "1:02:05"
@@ -0,0 +1,157 @@
+"""
+Persistent censor_video.py worker for the processing queue.
+
+Keeps a single `censor_video.py --daemon` process alive between queue
+items so each job skips interpreter start-up and the heavy detection
+imports. Jobs are sent as JSON argument lists on stdin; output streams
+back on stdout and each job ends with a JOB_DONE marker.
+"""
+
+import codecs
+import json
+import os
+import selectors
+import subprocess
+import threading
+from typing import Dict, Iterator, List, Optional
+
+# Must match censor_video.DAEMON_JOB_DONE. The leading ASCII record
+# separator never appears in normal output, so the marker is found even
+# mid-line, after a tqdm bar that ended in \r rather than a newline
+DAEMON_JOB_DONE = "\x1eJOB_DONE"
+
+# Bytes pulled from the worker's stdout per read
+READ_CHUNK_SIZE = 1 << 16
+
+# Seconds between cancellation checks while the worker is silent
+CANCEL_POLL_INTERVAL = 0.25
+
+
+class CensorDaemon:
+    """Runs censor jobs one at a time in a reusable subprocess."""
+
+    def __init__(self, launch_cmd: List[str]):
+        """
+        Args:
+            launch_cmd: Command that runs censor_video.py (without arguments)
+        """
+        self.launch_cmd = launch_cmd
+        self.process: Optional[subprocess.Popen] = None
+        self.returncode: Optional[int] = None
+        self._cancelled = threading.Event()
+
+    def _ensure_running(self, env: Optional[Dict[str, str]]) -> None:
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(
+                self.launch_cmd + ["--daemon"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=env,
+                # Binary, unbuffered pipes: output is read straight off the fd
+                # in large chunks and decoded once per chunk, so a text
+                # wrapper would only add per-line work
+                bufsize=0
+            )
+
+    def start_job(self, args: List[str], env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+        """
+        Send a job to the worker, starting (or restarting) it if needed.
+
+        Returns the worker process so callers can terminate it to cancel.
+        """
+        self.returncode = None
+        self._cancelled = threading.Event()  # Per job, so a late cancel() can't leak into the next
+        request = (json.dumps(args) + "\n").encode("utf-8")
+        self._ensure_running(env)
+        try:
+            self.process.stdin.write(request)
+        except BrokenPipeError:
+            # Worker died while idle; start a fresh one and resend
+            self._close_pipes()
+            self.process = None
+            self._ensure_running(env)
+            self.process.stdin.write(request)
+        return self.process
+
+    def iter_output(self) -> Iterator[str]:
+        """
+        Yield output lines for the current job.
+
+        Sets returncode when the job's JOB_DONE marker arrives, or when the
+        worker exits mid-job (crash or cancellation). After cancel() this
+        returns within CANCEL_POLL_INTERVAL even if the worker has hung.
+        """
+        process = self.process
+        cancelled = self._cancelled
+        fd = process.stdout.fileno()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+
+            # Read whatever the pipe holds (up to 64 KiB) per syscall and split
+            # it into lines here, rather than a read per line
+            while not cancelled.is_set():
+                if not selector.select(CANCEL_POLL_INTERVAL):
+                    continue
+                chunk = os.read(fd, READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+                for line in lines:
+                    marker = line.find(DAEMON_JOB_DONE)
+                    if marker != -1:
+                        if marker:
+                            yield line[:marker] + "\n"
+                        self.returncode = int(line[marker + len(DAEMON_JOB_DONE):])
+                        return
+                    yield line + "\n"
+
+        if cancelled.is_set():
+            # Don't wait on output that may never come (e.g. a hung ffmpeg
+            # still holding the pipe); the next job starts a fresh worker
+            self._terminate(process)
+            if self.process is process:
+                self.process = None
+        elif pending:
+            yield pending
+
+        # Worker exited without finishing the job
+        self.returncode = process.wait() or 1
+        self._close_pipes(process)
+
+    def cancel(self) -> None:
+        """Abort the current job; iter_output() stops and the worker is killed."""
+        self._cancelled.set()
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+
+    @staticmethod
+    def _terminate(process: subprocess.Popen) -> None:
+        try:
+            process.terminate()
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _close_pipes(self, process: Optional[subprocess.Popen] = None) -> None:
+        process = process or self.process
+        for pipe in (process.stdin, process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        """Shut the worker down (it exits on stdin EOF)."""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=2)
+        except Exception:
+            self.process.kill()
+        self._close_pipes()
+        self.process = None
@@ -0,0 +1,74 @@
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt, Signal, QRectF
+from PySide6.QtGui import QPainter, QColor, QPen
+
+
+class SegmentedControl(QWidget):
+    """
+    A row of mutually exclusive segments painted by a single widget.
+
+    Replaces a slider plus one label per step: selection changes repaint
+    this widget once instead of updating several child widgets.
+    """
+
+    valueChanged = Signal(int)
+
+    BG_COLOR = QColor("#1a1a25")
+    BORDER_COLOR = QColor("#282838")
+    SELECTED_COLOR = QColor("#6366f1")
+    TEXT_COLOR = QColor("#a0a0b0")
+    SELECTED_TEXT_COLOR = QColor("#ffffff")
+
+    def __init__(self, options: list, value: int = 0, parent=None):
+        super().__init__(parent)
+        self._options = list(options)
+        self._value = value
+
+        self.setMinimumHeight(28)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def value(self) -> int:
+        return self._value
+
+    def setValue(self, value: int):
+        value = max(0, min(value, len(self._options) - 1))
+        if value == self._value:
+            return
+        self._value = value
+        self.update()
+        self.valueChanged.emit(value)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self._options:
+            segment_width = self.width() / len(self._options)
+            self.setValue(int(event.position().x() // segment_width))
+
+    def paintEvent(self, event):
+        if not self._options:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(self.BORDER_COLOR, 1))
+        painter.setBrush(self.BG_COLOR)
+        painter.drawRoundedRect(rect, 6, 6)
+
+        font = painter.font()
+        font.setPixelSize(10)
+        font.setBold(True)
+        painter.setFont(font)
+
+        segment_width = rect.width() / len(self._options)
+        for i, label in enumerate(self._options):
+            seg_rect = QRectF(rect.left() + i * segment_width, rect.top(), segment_width, rect.height())
+            if i == self._value:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self.SELECTED_COLOR)
+                painter.drawRoundedRect(seg_rect.adjusted(2, 2, -2, -2), 4, 4)
+                painter.setPen(self.SELECTED_TEXT_COLOR)
+            else:
+                painter.setPen(self.TEXT_COLOR)
+            painter.drawText(seg_rect, Qt.AlignCenter, label)
@@ -28,9 +28,13 @@ from ui.components.tier_header import TierHeader
 from video_censor.profanity.severity import get_severity
 from video_censor.undo_manager import UndoManager
 from collections import defaultdict
+from functools import partial
 from copy import deepcopy
 from video_censor.config import Config
 
+# Same file main_window.CONFIG_PATH points at
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
 
 class CollapsibleSection(QFrame):
     """A collapsible section with header and content."""
@@ -42,6 +46,7 @@ class CollapsibleSection(QFrame):
         self.color = color
         self.is_collapsed = True
         self.count = 0
+        self._builder = None  # Deferred content builder, run on first expand
         
         self._create_ui()
         
@@ -86,9 +91,28 @@ class CollapsibleSection(QFrame):
         
     def _toggle(self):
         self.is_collapsed = not self.is_collapsed
+        if not self.is_collapsed:
+            self._build_content()
         self.content.setVisible(not self.is_collapsed)
         self._update_header()
         
+    def set_builder(self, builder):
+        """
+        Replace the content with whatever builder(section) adds.
+        
+        The builder only runs once the section is expanded, so collapsed
+        sections don't pay for widgets nobody is looking at.
+        """
+        self.clear()
+        self._builder = builder
+        if not self.is_collapsed:
+            self._build_content()
+        
+    def _build_content(self):
+        builder, self._builder = self._builder, None
+        if builder is not None:
+            builder(self)
+        
     def set_count(self, count: int):
         self.count = count
         self._update_header()
@@ -97,6 +121,7 @@ class CollapsibleSection(QFrame):
         self.content_layout.addWidget(widget)
         
     def clear(self):
+        self._builder = None
         while self.content_layout.count():
             item = self.content_layout.takeAt(0)
             if item.widget():
@@ -140,7 +165,7 @@ class DetectionBrowserPanel(QFrame):
         
         # Load config for severity overrides
         try:
-            self.config = Config.load(Path(__file__).parent.parent / "config.yaml")
+            self.config = Config.load(CONFIG_PATH)
         except Exception as e:
             print(f"Error loading config in DetectionBrowser: {e}")
             self.config = Config()
@@ -570,24 +595,23 @@ class DetectionBrowserPanel(QFrame):
         else:
             self._build_detection_cards(to_review)
         
-        # Build Kept
+        # Kept/Deleted cards are built when their section is expanded
         self.kept_section.set_count(len(kept))
-        for segment in kept:
-            card = MiniDetectionCard(segment, 'kept')
-            card.restore_clicked.connect(lambda s: self._restore_segment(s, 'kept'))
-            card.card_clicked.connect(self._on_card_clicked)
-            self.kept_section.add_widget(card)
-            
-        # Build Deleted
+        self.kept_section.set_builder(partial(self._build_mini_cards, list(kept), 'kept'))
+        
         self.deleted_section.set_count(len(deleted))
-        for segment in deleted:
-            card = MiniDetectionCard(segment, 'deleted')
-            card.restore_clicked.connect(lambda s: self._restore_segment(s, 'deleted'))
-            card.card_clicked.connect(self._on_card_clicked)
-            self.deleted_section.add_widget(card)
+        self.deleted_section.set_builder(partial(self._build_mini_cards, list(deleted), 'deleted'))
             
         self._update_tab_counts()
         
+    def _build_mini_cards(self, segments: list, from_section: str, section: CollapsibleSection):
+        """Fill a Kept/Deleted section with restorable mini cards."""
+        for segment in segments:
+            card = MiniDetectionCard(segment, from_section)
+            card.restore_clicked.connect(lambda s: self._restore_segment(s, from_section))
+            card.card_clicked.connect(self._on_card_clicked)
+            section.add_widget(card)
+        
     def _build_detection_cards(self, to_review: list):
         """Build individual detection cards."""
         total = len(to_review)
@@ -4,11 +4,18 @@ Main Window for Video Censor Desktop App.
 Provides the primary UI with drag-and-drop, preference manager, and processing queue.
 """
 
+import copy
+import dataclasses
+import functools
+import logging
 import os
+import queue
+import re
 import subprocess
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
@@ -17,8 +24,10 @@ from PySide6.QtWidgets import (
     QSplitter, QSizePolicy, QGroupBox, QToolButton, QSpacerItem, QSlider, QLineEdit,
     QTabWidget, QStackedWidget, QTimeEdit, QStyle, QMenuBar, QMenu, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot, QMimeData, QTimer, QTime
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont, QAction, QKeySequence
+from PySide6.QtCore import Qt, Signal, Slot, QMimeData, QTimer, QTime, QRect
+from PySide6.QtGui import (
+    QDragEnterEvent, QDropEvent, QFont, QFontMetrics, QAction, QKeySequence, QPainter, QPixmap
+)
 import json
 
 import sys
@@ -27,26 +36,121 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from .search_tab import SearchTab
 from .review_panel import ReviewPanel
 from .components.shortcuts_overlay import ShortcutsOverlay
+from .components.segmented_control import SegmentedControl
+from .censor_daemon import CensorDaemon
+from .profile_dialog import ProfileDialog
 from video_censor.preferences import ContentFilterSettings, Profile
 from video_censor.profile_manager import ProfileManager
 from video_censor.queue import QueueItem, ProcessingQueue
 from video_censor.detection.serializer import DetectionSerializer, save_detections
-from video_censor.config import Config
+from video_censor.config import Config, write_config_text
 from video_censor.recent_files import get_recent_files, add_recent_file, clear_recent_files
 from video_censor.video_info import get_video_info
 from video_censor.file_utils import open_folder, reveal_in_finder
 from video_censor.notifications import notify_processing_complete, notify_render_complete
 
+logger = logging.getLogger(__name__)
+
 
 # Supported video formats
-VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.mov', '.m4v', '.wmv', '.flv', '.webm')
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.m4v', '.wmv', '.flv', '.webm'})
+# File-dialog filter built from the same set, so browsing and dropping agree
+VIDEO_FILE_FILTER = "Video Files ({})".format(" ".join(f"*{ext}" for ext in sorted(VIDEO_EXTENSIONS)))
 OUTPUT_DIR = str(Path.home() / "Movies" / "VideoCensor")
+OUTPUT_DIR_PATH = Path(OUTPUT_DIR)
+
+# Project paths, resolved once at import
+_HERE = Path(__file__).resolve().parent
+PROJECT_ROOT = _HERE.parent
+CONFIG_PATH = PROJECT_ROOT / "config.yaml"
+UI_DEBUG_LOG = PROJECT_ROOT / "ui_debug.log"
+VENV_PYTHON = os.fspath(PROJECT_ROOT / "venv" / "bin" / "python")
+CENSOR_SCRIPT = os.fspath(PROJECT_ROOT / "censor_video.py")
+# Launches the persistent censor worker; arch -arm64 matches the venv's libraries
+CENSOR_DAEMON_CMD = ("arch", "-arm64", VENV_PYTHON, "-u", CENSOR_SCRIPT)
+
+# Output quality presets: (display name, config key)
+QUALITY_PRESETS = (
+    ("Original Quality", "original"),
+    ("Auto Convert", "auto"),
+    ("4K UHD (High) 40 Mbps", "4k_high"),
+    ("4K UHD (Med) 24 Mbps", "4k_med"),
+    ("4K UHD 18 Mbps", "4k_low"),
+    ("1080p HD (High) 20 Mbps", "1080p_high"),
+    ("1080p HD (Med) 12 Mbps", "1080p_med"),
+    ("1080p HD 10 Mbps", "1080p_10"),
+    ("1080p HD 8 Mbps", "1080p_low"),
+    ("720p HD (High) 4 Mbps", "720p_high"),
+    ("720p HD (Med) 3 Mbps", "720p_med"),
+    ("720p HD 2 Mbps", "720p_low"),
+    ("480p 1.5 Mbps", "480p"),
+    ("328p 0.7 Mbps", "328p"),
+    ("240p 0.3 Mbps", "240p"),
+    ("160p 0.2 Mbps", "160p"),
+)
+
+
+# "STEP n" stage markers printed by censor_video.py, matched in one pass,
+# mapped to (progress, status) for the analysis and export runs
+_STEP_RE = re.compile(r"STEP (2\.5|2\.7|1|2|3|4)\b")
+_ANALYSIS_STEPS = {
+    "1": (0.05, "Starting parallel analysis..."),
+    "2.5": (0.50, "Sexual content detection..."),
+    "2.7": (0.51, "Violence detection..."),
+    "3": (0.52, "Planning edits..."),
+}
+_EXPORT_STEPS = {
+    "3": (0.55, "Planning edits..."),
+    "4": (0.60, "Rendering video..."),
+}
+
+# censor_video.py flags for (filter_language, filter_nudity)
+_FILTER_FLAGS = {
+    (False, False): ("--no-profanity", "--no-nudity"),
+    (False, True): ("--no-profanity",),
+    (True, False): ("--no-nudity",),
+    (True, True): (),
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path_str: str, signature: tuple) -> Config:
+    """Parse config.yaml once per on-disk version, keyed by (mtime_ns, size)."""
+    return Config.load(Path(path_str))
+
+
+def _load_config_cached(path_str: str, signature: tuple) -> Config:
+    """
+    A private copy of the parsed config.
+    
+    Callers mutate their Config and save it later (debounced), so handing
+    out the cached instance would leak unsaved edits to the next caller.
+    """
+    return copy.deepcopy(_parse_config(path_str, signature))
+
+
+def _glyph_pixmap(text: str, pixel_size: int, device_pixel_ratio: float) -> QPixmap:
+    """Rasterize a large emoji/glyph so labels blit it instead of re-shaping text."""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    metrics = QFontMetrics(font)
+    width, height = metrics.horizontalAdvance(text), metrics.height()
+    
+    pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, width, height), Qt.AlignCenter, text)
+    painter.end()
+    return pixmap
 
 
 class DropZone(QFrame):
     """Drag-and-drop zone for video files - Cinema styled."""
     
     file_dropped = Signal(str)
+    extra_files_dropped = Signal(list)  # Further videos from a multi-file drop
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -59,14 +163,15 @@ class DropZone(QFrame):
         layout.setSpacing(14)
         layout.setContentsMargins(28, 36, 28, 36)
         
-        # Film reel icon - cinema themed
-        icon_label = QLabel("🎬")
-        icon_label.setStyleSheet("""
-            font-size: 64px; 
-            background: transparent;
-        """)
-        icon_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(icon_label)
+        # Film reel icon - cinema themed, pre-rendered at 64px once the
+        # widget is shown on a screen and its pixel ratio is known
+        self._icon_label = QLabel()
+        self._icon_label.setStyleSheet("background: transparent;")
+        self._icon_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._icon_label)
+        self._icon_pixmaps: Dict[float, QPixmap] = {}  # By device pixel ratio
+        self._icon_ratio: Optional[float] = None
+        self._screen_window = None  # Window handle whose screenChanged is hooked
         
         # Main text - movie poster style
         text_label = QLabel("Drop Your Film Here")
@@ -105,6 +210,26 @@ class DropZone(QFrame):
         formats.setAlignment(Qt.AlignCenter)
         layout.addWidget(formats, alignment=Qt.AlignCenter)
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Follow the window to other screens (e.g. Retina <-> external display)
+        handle = self.window().windowHandle()
+        if handle is not None and handle is not self._screen_window:
+            self._screen_window = handle
+            handle.screenChanged.connect(self._update_icon)
+        self._update_icon()
+    
+    def _update_icon(self, *_):
+        """Show the film icon rendered for the current device pixel ratio."""
+        ratio = self.devicePixelRatioF()
+        if ratio == self._icon_ratio:
+            return
+        pixmap = self._icon_pixmaps.get(ratio)
+        if pixmap is None:
+            pixmap = self._icon_pixmaps[ratio] = _glyph_pixmap("🎬", 64, ratio)
+        self._icon_label.setPixmap(pixmap)
+        self._icon_ratio = ratio
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -121,11 +246,15 @@ class DropZone(QFrame):
     
     def dropEvent(self, event: QDropEvent):
         self.setStyleSheet("")
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith(VIDEO_EXTENSIONS):
-                self.file_dropped.emit(file_path)
-                break
+        videos = [
+            file_path for file_path in (url.toLocalFile() for url in event.mimeData().urls())
+            if os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
+        ]
+        if videos:
+            # The first video opens for review; the rest go straight to the queue
+            self.file_dropped.emit(videos[0])
+            if len(videos) > 1:
+                self.extra_files_dropped.emit(videos[1:])
 
 
 class VideoInfoBar(QFrame):
@@ -218,14 +347,43 @@ class PreferencePanel(QFrame):
         self.current_video_path: Optional[str] = None
         self.setProperty("class", "panel")
         
+        # Settings edits are coalesced into one config.yaml write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_config)
+        
+        # Parsed custom phrases, re-read from the editor only after it changes
+        self._phrases_cache: list = []
+        self._phrases_dirty = True
+        
+        # Single background config.yaml writer; every save hands it the
+        # latest YAML snapshot so writes never overlap or land out of order
+        self._config_write_lock = threading.Lock()
+        self._config_write_thread: Optional[threading.Thread] = None
+        self._config_pending_text: Optional[str] = None
+        
+        # get_current_settings() result, valid while the version is unchanged
+        self._settings_version = 0
+        self._settings_cache: Optional[ContentFilterSettings] = None
+        self._settings_cache_version = -1
+        
         # Load global config
         try:
-            config_path = Path(__file__).parent.parent / "config.yaml"
-            self.config = Config.load(config_path)
+            # Nanosecond mtime plus size, so a rewrite within the same second
+            # (or on a coarse-timestamp filesystem) isn't served stale
+            st = CONFIG_PATH.stat()
+            self.config = _load_config_cached(str(CONFIG_PATH), (st.st_mtime_ns, st.st_size))
         except Exception:
             self.config = Config()
         
-        self._create_ui()
+        # Build the whole tree with painting suspended so the panel lays out
+        # and paints once, not per added card
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_ui()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _create_ui(self):
         layout = QVBoxLayout(self)
@@ -261,7 +419,8 @@ class PreferencePanel(QFrame):
         
         self.profile_combo = QComboBox()
         self.profile_combo.setMinimumWidth(200)
-        self.profile_combo.addItems(self.profile_manager.list_names())
+        self._profile_names = self.profile_manager.list_names()
+        self.profile_combo.addItems(self._profile_names)
         self.profile_combo.currentTextChanged.connect(self._on_profile_change)
         profile_layout.addWidget(self.profile_combo)
         
@@ -280,29 +439,16 @@ class PreferencePanel(QFrame):
         filters_grid = QGridLayout()
         filters_grid.setSpacing(16)
         
-        # Language
-        self.cb_language = self._create_switch_card(
-            "Language", "Mute profanity", "cb_language", True
-        )
-        filters_grid.addWidget(self.cb_language, 0, 0)
-        
-        # Sexual Content
-        self.cb_sexual = self._create_switch_card(
-            "Sexual Content", "Cut explicit scenes", "cb_sexual", True
-        )
-        filters_grid.addWidget(self.cb_sexual, 0, 1)
-        
-        # Nudity
-        self.cb_nudity = self._create_switch_card(
-            "Nudity", "Visual detection", "cb_nudity", True
-        )
-        filters_grid.addWidget(self.cb_nudity, 1, 0)
-        
-        # Mature Themes
-        self.cb_mature = self._create_switch_card(
-            "Mature Themes", "Drugs, self-harm", "cb_mature", False
-        )
-        filters_grid.addWidget(self.cb_mature, 1, 1)
+        filter_cards = [
+            ("cb_language", "Language", "Mute profanity", True),
+            ("cb_sexual", "Sexual Content", "Cut explicit scenes", True),
+            ("cb_nudity", "Nudity", "Visual detection", True),
+            ("cb_mature", "Mature Themes", "Drugs, self-harm", False),
+        ]
+        for i, (name, card_title, subtitle, checked) in enumerate(filter_cards):
+            card = self._create_switch_card(card_title, subtitle, name, checked)
+            setattr(self, name, card)
+            filters_grid.addWidget(card, i // 2, i % 2)
         
         self.content_layout.addLayout(filters_grid)
         
@@ -331,25 +477,16 @@ class PreferencePanel(QFrame):
         actions_grid = QGridLayout()
         actions_grid.setSpacing(16)
         
-        self.combo_profanity = self._create_action_card(
-            "Profanity Action", "combo_profanity", ["Mute", "Beep"]
-        )
-        actions_grid.addWidget(self.combo_profanity, 0, 0)
-        
-        self.combo_nudity = self._create_action_card(
-            "Nudity Action", "combo_nudity", ["Cut", "Blur", "Blackout"]
-        )
-        actions_grid.addWidget(self.combo_nudity, 0, 1)
-        
-        self.combo_sexual = self._create_action_card(
-            "Sexual Content Action", "combo_sexual", ["Cut", "Blur", "Blackout"]
-        )
-        actions_grid.addWidget(self.combo_sexual, 1, 0)
-        
-        self.combo_violence = self._create_action_card(
-            "Violence Action", "combo_violence", ["Cut", "Blur", "Blackout"]
-        )
-        actions_grid.addWidget(self.combo_violence, 1, 1)
+        action_cards = [
+            ("combo_profanity", "Profanity Action", ["Mute", "Beep"]),
+            ("combo_nudity", "Nudity Action", ["Cut", "Blur", "Blackout"]),
+            ("combo_sexual", "Sexual Content Action", ["Cut", "Blur", "Blackout"]),
+            ("combo_violence", "Violence Action", ["Cut", "Blur", "Blackout"]),
+        ]
+        for i, (name, card_title, options) in enumerate(action_cards):
+            card = self._create_action_card(card_title, name, options)
+            setattr(self, name, card)
+            actions_grid.addWidget(card, i // 2, i % 2)
         
         self.content_layout.addLayout(actions_grid)
         
@@ -380,7 +517,7 @@ class PreferencePanel(QFrame):
         w_layout = QHBoxLayout(whisper_widget)
         w_layout.setContentsMargins(0, 0, 0, 0)
         w_label = QLabel("Speech Model:")
-        w_label.setStyleSheet("font-size: 11px; font-weight: 600; color: #a0a0b0;")
+        w_label.setProperty("class", "card-title")
         w_layout.addWidget(w_label)
         
         self.whisper_models = [
@@ -402,7 +539,7 @@ class PreferencePanel(QFrame):
         p_layout = QHBoxLayout(perf_widget)
         p_layout.setContentsMargins(0, 0, 0, 0)
         p_label = QLabel("Performance:")
-        p_label.setStyleSheet("font-size: 11px; font-weight: 600; color: #a0a0b0;")
+        p_label.setProperty("class", "card-title")
         p_layout.addWidget(p_label)
         
         self.performance_combo = QComboBox()
@@ -423,7 +560,7 @@ class PreferencePanel(QFrame):
         
         ph_header = QHBoxLayout()
         ph_title = QLabel("Custom Block Phrases")
-        ph_title.setStyleSheet("font-weight: 600; font-size: 11px; color: #a0a0b0;")
+        ph_title.setProperty("class", "card-title")
         ph_header.addWidget(ph_title)
         ph_hit = QLabel("(one per line)")
         ph_hit.setStyleSheet("font-size: 10px; color: #5a5a6a;")
@@ -445,6 +582,7 @@ class PreferencePanel(QFrame):
             }
             QPlainTextEdit:focus { border-color: #3b82f6; }
         """)
+        self.phrases_edit.textChanged.connect(self._on_phrases_changed)
         ph_layout.addWidget(self.phrases_edit)
         self.content_layout.addWidget(phrases_widget)
         
@@ -457,11 +595,11 @@ class PreferencePanel(QFrame):
         
         n_header = QHBoxLayout()
         n_label = QLabel("Notifications")
-        n_label.setStyleSheet("font-weight: 600; font-size: 11px; color: #a0a0b0;")
+        n_label.setProperty("class", "card-title")
         n_header.addWidget(n_label)
         n_header.addStretch()
         self.cb_notify_enabled = QCheckBox("Enable Push")
-        self.cb_notify_enabled.setStyleSheet("color: #b0b0c0; font-size: 11px;")
+        self.cb_notify_enabled.setProperty("class", "card-option")
         self.cb_notify_enabled.stateChanged.connect(self._save_settings)
         n_header.addWidget(self.cb_notify_enabled)
         n_layout.addLayout(n_header)
@@ -470,6 +608,8 @@ class PreferencePanel(QFrame):
         topic_row = QHBoxLayout()
         self.notify_topic_input = QLineEdit()
         self.notify_topic_input.setPlaceholderText("Ntfy Topic ID")
+        # Inline: the scroll area's unselected transparent/borderless rule
+        # would override an app-stylesheet class rule for these
         self.notify_topic_input.setStyleSheet("background: #0f0f14; border: 1px solid #282838; border-radius: 4px; padding: 4px; color: #e0e0e0; font-size: 11px;")
         self.notify_topic_input.editingFinished.connect(self._save_settings)
         topic_row.addWidget(self.notify_topic_input)
@@ -484,17 +624,17 @@ class PreferencePanel(QFrame):
         # Checkboxes
         opts_row = QHBoxLayout()
         self.cb_notify_complete = QCheckBox("Done")
-        self.cb_notify_complete.setStyleSheet("color: #b0b0c0; font-size: 10px;")
+        self.cb_notify_complete.setProperty("class", "card-option-small")
         self.cb_notify_complete.stateChanged.connect(self._save_settings)
         opts_row.addWidget(self.cb_notify_complete)
         
         self.cb_notify_error = QCheckBox("Error")
-        self.cb_notify_error.setStyleSheet("color: #b0b0c0; font-size: 10px;")
+        self.cb_notify_error.setProperty("class", "card-option-small")
         self.cb_notify_error.stateChanged.connect(self._save_settings)
         opts_row.addWidget(self.cb_notify_error)
         
         self.cb_notify_batch = QCheckBox("Batch")
-        self.cb_notify_batch.setStyleSheet("color: #b0b0c0; font-size: 10px;")
+        self.cb_notify_batch.setProperty("class", "card-option-small")
         self.cb_notify_batch.stateChanged.connect(self._save_settings)
         opts_row.addWidget(self.cb_notify_batch)
         
@@ -510,11 +650,11 @@ class PreferencePanel(QFrame):
         
         s_header = QHBoxLayout()
         s_label = QLabel("Cloud Sync")
-        s_label.setStyleSheet("font-weight: 600; font-size: 11px; color: #a0a0b0;")
+        s_label.setProperty("class", "card-title")
         s_header.addWidget(s_label)
         s_header.addStretch()
         self.cb_sync_enabled = QCheckBox("Enable Sync")
-        self.cb_sync_enabled.setStyleSheet("color: #b0b0c0; font-size: 11px;")
+        self.cb_sync_enabled.setProperty("class", "card-option")
         self.cb_sync_enabled.stateChanged.connect(self._save_settings)
         s_header.addWidget(self.cb_sync_enabled)
         s_layout.addLayout(s_header)
@@ -569,7 +709,7 @@ class PreferencePanel(QFrame):
         # Schedule
         schedule_layout = QHBoxLayout()
         self.schedule_cb = QCheckBox("Schedule Start:")
-        self.schedule_cb.setStyleSheet("color: #b0b0c0; font-size: 11px;")
+        self.schedule_cb.setProperty("class", "card-option")
         self.schedule_cb.toggled.connect(self._toggle_schedule)
         schedule_layout.addWidget(self.schedule_cb)
         
@@ -593,6 +733,8 @@ class PreferencePanel(QFrame):
         
         layout.addLayout(footer)
         
+        self._watch_settings_controls()
+        
         # Initialize
         self._init_quality_from_config()
         self._apply_profile_settings()
@@ -651,57 +793,21 @@ class PreferencePanel(QFrame):
         return card
 
     def _create_intensity_slider(self, title, object_name, steps):
-        """Create a slider card with labels."""
+        """Create a card with a segmented intensity selector."""
         card = QFrame()
         card.setProperty("class", "filter-card")
         layout = QVBoxLayout(card)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        header = QHBoxLayout()
         t_label = QLabel(title)
         t_label.setStyleSheet("font-weight: 600; font-size: 12px;")
-        header.addWidget(t_label)
-        header.addStretch()
-        
-        status_label = QLabel(steps[-1])
-        status_label.setStyleSheet("color: #3b82f6; font-size: 10px; font-weight: 600;")
-        header.addWidget(status_label)
-        layout.addLayout(header)
-        
-        slider = QSlider(Qt.Horizontal)
-        slider.setMinimum(0)
-        slider.setMaximum(len(steps) - 1)
-        slider.setTickPosition(QSlider.TicksBelow)
-        slider.setTickInterval(1)
-        slider.setValue(len(steps) - 1)
-        layout.addWidget(slider)
-        
-        # Labels row
-        labels_layout = QHBoxLayout()
-        labels_layout.setContentsMargins(4, 0, 4, 0)
-        for i, step in enumerate(steps):
-            lbl = QLabel(step)
-            lbl.setStyleSheet("color: #71717a; font-size: 9px;")
-            if i == 0:
-                lbl.setAlignment(Qt.AlignLeft)
-            elif i == len(steps) - 1:
-                lbl.setAlignment(Qt.AlignRight)
-            else:
-                lbl.setAlignment(Qt.AlignCenter)
-            labels_layout.addWidget(lbl)
-            if i < len(steps) - 1:
-                labels_layout.addStretch()
-                
-        layout.addLayout(labels_layout)
+        layout.addWidget(t_label)
         
-        # Update status label on change
-        def update_status(val):
-            status_label.setText(steps[val])
-            
-        slider.valueChanged.connect(update_status)
-        update_status(slider.value())
+        # One painted widget for every step instead of a slider + label per step
+        control = SegmentedControl(steps, value=len(steps) - 1)
+        layout.addWidget(control)
         
-        setattr(self, object_name, slider)
+        setattr(self, object_name, control)
         return card
 
     def _create_action_card(self, title, object_name, options):
@@ -713,7 +819,7 @@ class PreferencePanel(QFrame):
         layout.setSpacing(8)
         
         t_label = QLabel(title)
-        t_label.setStyleSheet("font-weight: 600; font-size: 11px; color: #a0a0b0;")
+        t_label.setProperty("class", "card-title")
         layout.addWidget(t_label)
         
         combo = QComboBox()
@@ -743,8 +849,16 @@ class PreferencePanel(QFrame):
     def _apply_profile_settings(self):
         profile_name = self.profile_combo.currentText()
         profile = self.profile_manager.get_or_default(profile_name)
-        settings = profile.settings
         
+        # Switching profiles flips up to eight controls; hold painting until
+        # all of them are set so the panel repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_controls_from(profile.settings)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _set_controls_from(self, settings: ContentFilterSettings):
         self.cb_language.findChild(QCheckBox).setChecked(settings.filter_language)
         self.cb_sexual.findChild(QCheckBox).setChecked(settings.filter_sexual_content)
         self.cb_nudity.findChild(QCheckBox).setChecked(settings.filter_nudity)
@@ -752,8 +866,8 @@ class PreferencePanel(QFrame):
         
         # Map levels to slider values
         # Assuming backend stores level 0-N
-        self.romance_slider.findChild(QSlider).setValue(settings.filter_romance_level)
-        self.violence_slider.findChild(QSlider).setValue(settings.filter_violence_level)
+        self.romance_slider.findChild(SegmentedControl).setValue(settings.filter_romance_level)
+        self.violence_slider.findChild(SegmentedControl).setValue(settings.filter_violence_level)
         
         # Safe Cover
         self.cb_safe_cover.findChild(QCheckBox).setChecked(settings.safe_cover_enabled)
@@ -761,20 +875,52 @@ class PreferencePanel(QFrame):
         # Custom Phrases
         self.phrases_edit.setPlainText("\n".join(settings.custom_block_phrases))
     
+    def _watch_settings_controls(self):
+        """Invalidate the cached filter settings whenever a control changes."""
+        for card in (self.cb_language, self.cb_sexual, self.cb_nudity, self.cb_mature, self.cb_safe_cover):
+            card.findChild(QCheckBox).toggled.connect(self._bump_settings_version)
+        for card in (self.romance_slider, self.violence_slider):
+            card.findChild(SegmentedControl).valueChanged.connect(self._bump_settings_version)
+    
+    def _bump_settings_version(self, *_):
+        self._settings_version += 1
+    
+    def _on_phrases_changed(self):
+        self._phrases_dirty = True
+        self._settings_version += 1
+    
+    def _get_custom_phrases(self) -> list:
+        """Parsed custom phrases, cached until the editor text changes."""
+        if self._phrases_dirty:
+            self._phrases_cache = [
+                p.strip() for p in self.phrases_edit.toPlainText().split("\n") if p.strip()
+            ]
+            self._phrases_dirty = False
+        return list(self._phrases_cache)
+    
     def get_current_settings(self) -> ContentFilterSettings:
         """Get the current filter settings from controls."""
-        phrases = [p.strip() for p in self.phrases_edit.toPlainText().split("\n") if p.strip()]
+        if self._settings_cache_version == self._settings_version:
+            # Hand out a copy so callers can't alter the cached settings
+            return dataclasses.replace(
+                self._settings_cache,
+                custom_block_phrases=list(self._settings_cache.custom_block_phrases)
+            )
         
-        return ContentFilterSettings(
+        phrases = self._get_custom_phrases()
+        
+        self._settings_cache = ContentFilterSettings(
             filter_language=self.cb_language.findChild(QCheckBox).isChecked(),
             filter_sexual_content=self.cb_sexual.findChild(QCheckBox).isChecked(),
             filter_nudity=self.cb_nudity.findChild(QCheckBox).isChecked(),
-            filter_romance_level=self.romance_slider.findChild(QSlider).value(),
-            filter_violence_level=self.violence_slider.findChild(QSlider).value(),
+            filter_romance_level=self.romance_slider.findChild(SegmentedControl).value(),
+            filter_violence_level=self.violence_slider.findChild(SegmentedControl).value(),
             filter_mature_themes=self.cb_mature.findChild(QCheckBox).isChecked(),
             custom_block_phrases=phrases,
             safe_cover_enabled=self.cb_safe_cover.findChild(QCheckBox).isChecked()
         )
+        self._settings_cache_version = self._settings_version
+        return self.get_current_settings()
     
     def _save_defaults(self):
         profile_name = self.profile_combo.currentText()
@@ -808,9 +954,17 @@ class PreferencePanel(QFrame):
             self.schedule_cb.setChecked(False)
             
     def refresh_profiles(self):
+        names = self.profile_manager.list_names()
+        if names == self._profile_names:
+            # Nothing added, renamed or removed - keep the combo as is, but
+            # the current profile's settings may have been edited
+            self._apply_profile_settings()
+            return
+        self._profile_names = names
+        
         current = self.profile_combo.currentText()
         self.profile_combo.clear()
-        self.profile_combo.addItems(self.profile_manager.list_names())
+        self.profile_combo.addItems(names)
         idx = self.profile_combo.findText(current)
         if idx >= 0:
             self.profile_combo.setCurrentIndex(idx)
@@ -860,17 +1014,43 @@ class PreferencePanel(QFrame):
         self.config.sync.enabled = self.cb_sync_enabled.isChecked()
         self.config.sync.user_id = self.sync_uid_input.text().strip()
         
+        # Update UI status
+        if self.config.sync.enabled:
+            self.sync_status_label.setText("Enabled (Auto-sync on start/exit)")
+        else:
+            self.sync_status_label.setText("Disabled")
+        
+        # Toggling several options in a row restarts the timer, so the
+        # YAML is dumped once after the last change
+        self._save_timer.start()
+    
+    def _flush_config(self):
+        """Write pending settings changes to config.yaml."""
+        self._save_timer.stop()
+        self.save_config_async()
+    
+    def flush_pending_save(self, wait: bool = True):
+        """
+        Write out a debounced settings save that has not fired yet.
+        
+        With wait, also block until it (and any earlier write) has landed;
+        otherwise it is only handed to the background writer.
+        """
+        if self._save_timer.isActive():
+            self._flush_config()
+        if wait:
+            self.wait_for_config_write()
+    
+    def save_config_async(self):
+        """Queue the current self.config for the background writer."""
+        # This write covers any debounced save still pending
+        self._save_timer.stop()
         try:
-            config_path = Path(__file__).parent.parent / "config.yaml"
-            self.config.save(config_path)
-            
-            # Update UI status
-            if self.config.sync.enabled:
-                self.sync_status_label.setText("Enabled (Auto-sync on start/exit)")
-            else:
-                self.sync_status_label.setText("Disabled")
+            # Serialize now for a consistent snapshot; the disk write runs on
+            # the writer thread so the UI doesn't wait on it
+            self._write_config_async(self.config.to_yaml())
         except Exception as e:
-            print(f"Failed to save settings: {e}")
+            print(f"Failed to save config: {e}")
     
     def save_quality_to_config(self):
         """Save current quality settings to self.config and disk."""
@@ -894,11 +1074,40 @@ class PreferencePanel(QFrame):
         self.config.sync.enabled = self.cb_sync_enabled.isChecked()
         self.config.sync.user_id = self.sync_uid_input.text().strip()
         
-        try:
-            config_path = Path(__file__).parent.parent / "config.yaml"
-            self.config.save(config_path)
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+        self.save_config_async()
+    
+    def _write_config_async(self, text: str):
+        with self._config_write_lock:
+            # A snapshot still waiting is superseded by this newer one
+            self._config_pending_text = text
+            if self._config_write_thread is not None:
+                return  # The running writer picks it up
+            self._config_write_thread = threading.Thread(
+                target=self._config_writer_loop, name="config-save"
+            )
+            self._config_write_thread.start()
+    
+    def _config_writer_loop(self):
+        while True:
+            with self._config_write_lock:
+                text = self._config_pending_text
+                self._config_pending_text = None
+                if text is None:
+                    self._config_write_thread = None
+                    return
+            try:
+                write_config_text(CONFIG_PATH, text)
+            except Exception as e:
+                print(f"Failed to save config: {e}")
+    
+    def wait_for_config_write(self):
+        """Block until every queued config.yaml write has finished."""
+        while True:
+            with self._config_write_lock:
+                thread = self._config_write_thread
+            if thread is None or thread is threading.current_thread():
+                return
+            thread.join()
     
     def _test_notification(self):
         """Send a test notification to verify setup."""
@@ -1015,11 +1224,11 @@ class PreferencePanel(QFrame):
             
             status_msg = "Synced just now" if success else "Sync Failed"
             
-            QTimer.singleShot(0, lambda: self._on_sync_complete(status_msg))
+            QTimer.singleShot(0, functools.partial(self._on_sync_complete, status_msg))
             
         except Exception as e:
             print(f"Sync error: {e}")
-            QTimer.singleShot(0, lambda: self._on_sync_complete(f"Error: {str(e)[:20]}"))
+            QTimer.singleShot(0, functools.partial(self._on_sync_complete, f"Error: {str(e)[:20]}"))
 
     def _on_sync_complete(self, message):
         """Handle sync completion on main thread."""
@@ -1028,12 +1237,47 @@ class PreferencePanel(QFrame):
 
 
 
+@functools.lru_cache(maxsize=64)
+def _filter_icons(language: bool, nudity: bool, sexual: bool, violence_level: int) -> tuple:
+    """(icon, tooltip) tags for a filter combination; at most three are shown."""
+    icons = []
+    if language:
+        icons.append(("🔇", "Profanity filter"))
+    if nudity:
+        icons.append(("👁", "Nudity detection"))
+    if sexual:
+        icons.append(("💕", "Sexual content filter"))
+    if violence_level > 0:
+        icons.append(("⚔️", f"Violence level {violence_level}"))
+    return tuple(icons[:3])
+
+
+# Queue item status label colors
+_STATUS_COLORS = {
+    'pending': "#71717a",
+    'processing': "#3b82f6",
+    'complete': "#22c55e",
+    'error': "#ef4444",
+    'cancelled': "#71717a"
+}
+
+
+def _item_display_state(item: QueueItem) -> tuple:
+    """Everything QueueItemWidget.update_display() renders, for cheap change detection."""
+    return (
+        item.status, item.status_display(), item.progress,
+        getattr(item, 'audio_progress', 0), getattr(item, 'video_progress', 0),
+        getattr(item, 'time_remaining', ''),
+    )
+
+
 class QueueItemWidget(QFrame):
     """Widget representing a single queue item."""
     
     def __init__(self, item: QueueItem, parent=None):
         super().__init__(parent)
         self.item = item
+        self._shown_state = None  # Last state applied by update_display()
         self.setStyleSheet("background: #0f0f14; border-radius: 6px; padding: 8px;")
         
         layout = QVBoxLayout(self)
@@ -1059,17 +1303,14 @@ class QueueItemWidget(QFrame):
         tags_layout.addWidget(profile_tag)
         
         # Filter indicator icons (clearer than cryptic abbreviations)
-        filter_icons = []
-        if item.filters.filter_language:
-            filter_icons.append(("🔇", "Profanity filter"))
-        if item.filters.filter_nudity:
-            filter_icons.append(("👁", "Nudity detection"))
-        if item.filters.filter_sexual_content:
-            filter_icons.append(("💕", "Sexual content filter"))
-        if item.filters.filter_violence_level > 0:
-            filter_icons.append(("⚔️", f"Violence level {item.filters.filter_violence_level}"))
-        
-        for icon, tooltip in filter_icons[:3]:
+        filter_icons = _filter_icons(
+            item.filters.filter_language,
+            item.filters.filter_nudity,
+            item.filters.filter_sexual_content,
+            item.filters.filter_violence_level,
+        )
+        
+        for icon, tooltip in filter_icons:
             icon_label = QLabel(icon)
             icon_label.setStyleSheet("background: #252530; padding: 3px 6px; border-radius: 4px; font-size: 11px;")
             icon_label.setToolTip(tooltip)
@@ -1230,14 +1471,7 @@ class QueueItemWidget(QFrame):
             window._delete_queue_item(self.item.id)
     
     def _status_color(self) -> str:
-        colors = {
-            'pending': "#71717a",
-            'processing': "#3b82f6",
-            'complete': "#22c55e",
-            'error': "#ef4444",
-            'cancelled': "#71717a"
-        }
-        return colors.get(self.item.status, "#71717a")
+        return _STATUS_COLORS.get(self.item.status, "#71717a")
     
     def _set_elided_filename(self, filename: str):
         """Set filename with middle elision for long names"""
@@ -1250,9 +1484,21 @@ class QueueItemWidget(QFrame):
             elided = filename
         self.name_label.setText(elided)
     
+    def _display_state(self) -> tuple:
+        return _item_display_state(self.item)
+    
     def update_display(self):
+        state = self._display_state()
+        if state == self._shown_state:
+            return
+        status_changed = self._shown_state is None or state[0] != self._shown_state[0]
+        self._shown_state = state
+        
         self.status_label.setText(self.item.status_display())
-        self.status_label.setStyleSheet(f"color: {self._status_color()}; font-size: 11px; background: transparent;")
+        if status_changed:
+            # Restyling re-polishes the label, so only do it when the color changes;
+            # plain progress ticks just move the bars below
+            self.status_label.setStyleSheet(f"color: {self._status_color()}; font-size: 11px; background: transparent;")
         self.progress_bar.setValue(int(self.item.progress * 100))
         
         # Parallel Progress Logic
@@ -1290,7 +1536,17 @@ class QueuePanel(QFrame):
         self.queue = queue
         self.setProperty("class", "panel")
         self._item_widgets = {}
+        self._last_refresh_sig = None  # Queue state the widgets last showed
         self.paused = False
+        # Rows whose progress changed while scrolled out of view
+        self._stale_item_ids = set()
+        
+        # Progress ticks mark items dirty; one timer repaints them together
+        self._dirty_item_ids = set()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_item_updates)
         
         self._create_ui()
     
@@ -1437,6 +1693,11 @@ class QueuePanel(QFrame):
         scroll.setWidget(self.items_widget)
         layout.addWidget(scroll, 1)
         
+        # Catch up rows that were skipped while out of view as they scroll in
+        scrollbar = scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._update_visible_stale_items)
+        scrollbar.rangeChanged.connect(self._update_visible_stale_items)
+        
         # Empty state
         self.empty_label = QLabel("🎬\n\nYour queue is empty\nAdd videos to get started")
         self.empty_label.setAlignment(Qt.AlignCenter)
@@ -1444,42 +1705,134 @@ class QueuePanel(QFrame):
         self.items_layout.insertWidget(0, self.empty_label)
     
     def refresh(self):
-        """Refresh the queue display."""
-        # Clear existing widgets
-        for widget in self._item_widgets.values():
-            widget.deleteLater()
-        self._item_widgets.clear()
+        """Refresh the queue display, reusing widgets for items already shown."""
+        # Nothing added, removed, reordered or progressed: leave the widgets be
+        sig = tuple((item.id, _item_display_state(item)) for item in self.queue.items)
+        if sig == self._last_refresh_sig:
+            return
+        self._last_refresh_sig = sig
         
+        # Apply every add/remove/move first, then lay out and paint once.
+        # With the layout disabled, inserts don't each recompute geometry
+        # (and the scroll area's size); it is activated a single time below.
+        self.items_widget.setUpdatesEnabled(False)
+        self.items_layout.setEnabled(False)
+        try:
+            self._reconcile_items()
+        finally:
+            self.items_layout.setEnabled(True)
+            self.items_layout.activate()
+            self.items_widget.setUpdatesEnabled(True)
+    
+    def _reconcile_items(self):
+        """Bring the item widgets in line with the queue contents."""
         items = self.queue.items
+        current_ids = {item.id for item in items}
         
-        self.empty_label.setVisible(len(items) == 0)
+        # Drop widgets for items that have left the queue
+        for item_id in [i for i in self._item_widgets if i not in current_ids]:
+            widget = self._item_widgets.pop(item_id)
+            self.items_layout.removeWidget(widget)
+            widget.deleteLater()
         
+        self.empty_label.setVisible(len(items) == 0)
+        self._update_count_label()
+        
+        # Layout is [empty_label, items..., stretch]; keep items in queue order
+        for index, item in enumerate(items, start=1):
+            widget = self._item_widgets.get(item.id)
+            if widget is None:
+                widget = QueueItemWidget(item)
+                self._item_widgets[item.id] = widget
+                self.items_layout.insertWidget(index, widget)
+                continue
+            
+            widget.item = item
+            widget.update_display()
+            if self.items_layout.indexOf(widget) != index:
+                self.items_layout.removeWidget(widget)
+                self.items_layout.insertWidget(index, widget)
+    
+    def _update_count_label(self):
+        items = self.queue.items
         if items:
             complete = self.queue.complete_count
             total = len(items)
             self.count_label.setText(f"{complete} of {total} complete")
         else:
             self.count_label.setText("Queue empty")
-        
-        for item in items:
-            widget = QueueItemWidget(item)
-            self._item_widgets[item.id] = widget
-            self.items_layout.insertWidget(self.items_layout.count() - 1, widget)
     
     def update_item(self, item_id: str):
         """Update a specific item."""
         if item_id in self._item_widgets:
+            self._stale_item_ids.discard(item_id)
             self._item_widgets[item_id].update_display()
+    
+    def update_item_status(self, item_id: str):
+        """
+        Update one item after a status change that keeps it in the queue.
+        
+        Cheaper than refresh(): only that item's widget and the count label
+        are touched. Use refresh() when items are added or removed.
+        """
+        self.update_item(item_id)
+        self._update_count_label()
+    
+    def update_item_progress(self, item_id: str):
+        """
+        Update an item after a progress tick.
+        
+        Rows scrolled out of view (or on a hidden panel) aren't redrawn
+        until they're shown, so a long queue costs only what's on screen.
+        """
+        widget = self._item_widgets.get(item_id)
+        if widget is None:
+            return
+        if widget.visibleRegion().isEmpty():
+            self._stale_item_ids.add(item_id)
+        else:
+            widget.update_display()
+    
+    def _update_visible_stale_items(self, *_):
+        for item_id in list(self._stale_item_ids):
+            widget = self._item_widgets.get(item_id)
+            if widget is None:
+                self._stale_item_ids.discard(item_id)
+            elif not widget.visibleRegion().isEmpty():
+                widget.update_display()
+                self._stale_item_ids.discard(item_id)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale_item_ids:
+            # Visible regions are only known once the show has been laid out
+            QTimer.singleShot(0, self._update_visible_stale_items)
+    
+    def schedule_item_update(self, item_id: str):
+        """
+        Update an item within the next 100 ms.
+        
+        For high-rate progress updates: however often an item reports,
+        its widget is redrawn at most ten times a second.
+        """
+        self._dirty_item_ids.add(item_id)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_item_updates(self):
+        dirty, self._dirty_item_ids = self._dirty_item_ids, set()
+        for item_id in dirty:
+            self.update_item_progress(item_id)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
-    # Signals for thread-safe updates
-    progress_update = Signal(str, float, str)  # id, progress, status
+    # Signals for thread-safe updates (progress goes through _progress_q)
     item_complete = Signal(str)  # id
     item_failed = Signal(str, str)  # id, error
     item_review_ready = Signal(str)  # id
+    video_info_ready = Signal(str, object)  # path, VideoInfo or None
     
     def __init__(self):
         super().__init__()
@@ -1502,13 +1855,32 @@ class MainWindow(QMainWindow):
         self.processing = False
         self.current_item: Optional[QueueItem] = None
         self.current_process = None # Handle to running subprocess
+        self.censor_daemon: Optional[CensorDaemon] = None # Reused across queue items
         self.detections_modified = False # Track unsaved changes
+        self._last_video_info = None # (path, (mtime_ns, size), VideoInfo) of the last probe
+        
+        # Environment for the censor worker, built once. The daemon only
+        # reads it when it is spawned, so a per-job rebuild would be unused
+        self._child_env = os.environ.copy()
+        self._child_env["PATH"] = f"/opt/homebrew/bin:{self._child_env.get('PATH', '')}"
+        self._child_env["PYTHONUNBUFFERED"] = "1"  # Force unbuffered output
+        
+        # Worker threads queue (id, progress, status) here; the UI thread
+        # drains it at 20 Hz while a job runs instead of taking an event per line
+        self._progress_q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._progress_pump = QTimer(self)
+        self._progress_pump.setInterval(50)
+        self._progress_pump.timeout.connect(self._drain_progress)
+        # One worker: jobs share the single censor daemon, so they run in
+        # submission order and never overlap; the thread is reused per job
+        self._censor_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="censor")
+        self._censor_future: Optional[Future] = None
         
         # Connect signals
-        self.progress_update.connect(self.on_progress_update)
         self.item_complete.connect(self.on_item_complete)
         self.item_failed.connect(self.on_item_failed)
         self.item_review_ready.connect(self.on_item_review_ready)
+        self.video_info_ready.connect(self.on_video_info_ready)
         
         self._create_ui()
         self._create_menu()
@@ -1530,8 +1902,9 @@ class MainWindow(QMainWindow):
         self.scheduler_timer.timeout.connect(self._check_scheduled_items)
         self.scheduler_timer.start(60000) # 1 minute
         
-        # Check disk space on startup
-        self._check_disk_space()
+        # Check disk space once the window has painted; the filesystem probe
+        # (and any warning dialog) shouldn't delay the first frame
+        QTimer.singleShot(0, self._check_disk_space)
         
         # Shortcuts overlay (press ? or F1)
         self.shortcuts_overlay = ShortcutsOverlay(self)
@@ -1595,7 +1968,7 @@ class MainWindow(QMainWindow):
     
     def _open_video_dialog(self):
         """Open video dialog wrapping _file_dropped logic."""
-        path, _ = QFileDialog.getOpenFileName(self, "Open Video", "", "Video Files (*.mp4 *.mkv *.avi *.mov)")
+        path, _ = QFileDialog.getOpenFileName(self, "Open Video", "", VIDEO_FILE_FILTER)
         if path:
             add_recent_file(path)
             self._update_recent_menu()
@@ -1987,6 +2360,7 @@ class MainWindow(QMainWindow):
         
         self.drop_zone = DropZone()
         self.drop_zone.file_dropped.connect(self._on_file_dropped)
+        self.drop_zone.extra_files_dropped.connect(self._enqueue_videos)
         left_panel.addWidget(self.drop_zone)
         
         self.choose_btn = QPushButton("📂  Browse Collection")
@@ -2016,28 +2390,9 @@ class MainWindow(QMainWindow):
         self.quality_preset_combo = QComboBox()
         self.quality_preset_combo.setMinimumWidth(180)
         
-        # Quality presets
-        self.quality_presets = [
-            ("Original Quality", "original"),
-            ("Auto Convert", "auto"),
-            ("4K UHD (High) 40 Mbps", "4k_high"),
-            ("4K UHD (Med) 24 Mbps", "4k_med"),
-            ("4K UHD 18 Mbps", "4k_low"),
-            ("1080p HD (High) 20 Mbps", "1080p_high"),
-            ("1080p HD (Med) 12 Mbps", "1080p_med"),
-            ("1080p HD 10 Mbps", "1080p_10"),
-            ("1080p HD 8 Mbps", "1080p_low"),
-            ("720p HD (High) 4 Mbps", "720p_high"),
-            ("720p HD (Med) 3 Mbps", "720p_med"),
-            ("720p HD 2 Mbps", "720p_low"),
-            ("480p 1.5 Mbps", "480p"),
-            ("328p 0.7 Mbps", "328p"),
-            ("240p 0.3 Mbps", "240p"),
-            ("160p 0.2 Mbps", "160p"),
-        ]
-        
-        for display_name, _ in self.quality_presets:
-            self.quality_preset_combo.addItem(display_name)
+        # Preset keys ride along as item data, so no display -> key lookup is needed
+        for display_name, key in QUALITY_PRESETS:
+            self.quality_preset_combo.addItem(display_name, key)
         
         quality_row.addWidget(self.quality_preset_combo)
         left_panel.addLayout(quality_row)
@@ -2079,13 +2434,9 @@ class MainWindow(QMainWindow):
         self.review_panel.editor_requested.connect(self._on_editor_requested)
         self.stack.addWidget(self.review_panel)
         
-        # Page 2: Editor Panel
-        from .editor_panel import EditorPanel
-        self.editor_panel = EditorPanel()
-        self.editor_panel.export_requested.connect(self._on_editor_export)
-        self.editor_panel.close_requested.connect(self._on_editor_closed)
-        self.editor_panel.edit_created.connect(self._on_edit_created)
-        self.stack.addWidget(self.editor_panel)
+        # Page 2: Editor Panel - built by _get_editor_panel() the first time
+        # the editor is opened, since most sessions never use it
+        self.editor_panel = None
         
         content.addWidget(self.stack, 1)
         
@@ -2124,10 +2475,9 @@ class MainWindow(QMainWindow):
             
             # Load quality preset
             preset_key = getattr(config.output, 'quality_preset', 'original')
-            for i, (_, key) in enumerate(self.quality_presets):
-                if key == preset_key:
-                    self.quality_preset_combo.setCurrentIndex(i)
-                    break
+            index = self.quality_preset_combo.findData(preset_key)
+            if index >= 0:
+                self.quality_preset_combo.setCurrentIndex(index)
             
             # Load format
             self.format_combo.setCurrentText(config.output.video_format)
@@ -2140,17 +2490,16 @@ class MainWindow(QMainWindow):
             config = self.preference_panel.config
             
             # Save quality preset
-            idx = self.quality_preset_combo.currentIndex()
-            if 0 <= idx < len(self.quality_presets):
-                _, preset_key = self.quality_presets[idx]
+            preset_key = self.quality_preset_combo.currentData()
+            if preset_key is not None:
                 config.output.quality_preset = preset_key
             
             # Save format
             config.output.video_format = self.format_combo.currentText()
             
-            # Persist to disk
-            config_path = Path(__file__).parent.parent / "config.yaml"
-            config.save(config_path)
+            # Persist through the preference panel's writer, so this can't
+            # race the quality save made by the same Start click
+            self.preference_panel.save_config_async()
         except Exception as e:
             print(f"Failed to save output settings: {e}")
     
@@ -2178,7 +2527,7 @@ class MainWindow(QMainWindow):
             self,
             "Select Video File",
             "",
-            "Video Files (*.mp4 *.mkv *.avi *.mov *.m4v *.wmv);;All Files (*)"
+            f"{VIDEO_FILE_FILTER};;All Files (*)"
         )
         if file_path:
             self._on_file_dropped(file_path)
@@ -2219,7 +2568,7 @@ class MainWindow(QMainWindow):
         video_path_obj = Path(path)
         # Create output path (default)
         output_format = self.format_combo.currentText() if hasattr(self, 'format_combo') else "mp4"
-        output_path = Path(OUTPUT_DIR) / f"{video_path_obj.stem}.CENSORED.{output_format}"
+        output_path = OUTPUT_DIR_PATH / f"{video_path_obj.stem}.CENSORED.{output_format}"
         
         # Basic item setup for context
         self.current_item = QueueItem(
@@ -2229,10 +2578,14 @@ class MainWindow(QMainWindow):
              status="pending"
         )
         
-        # Get and display video info
-        info = get_video_info(path)
-        if info and hasattr(self, 'video_info_bar'):
-            self.video_info_bar.set_info(info)
+        # Probe video info off the UI thread (ffprobe can take seconds);
+        # re-opening the same unchanged file reuses the last result
+        self._info_probe_path = path
+        info = self._cached_video_info(path)
+        if info is not None:
+            self.on_video_info_ready(path, info)
+        else:
+            threading.Thread(target=self._probe_video_info, args=(path,), daemon=True).start()
         
         if self._check_saved_detections(path):
             # If loaded successfully, switch to review
@@ -2241,6 +2594,39 @@ class MainWindow(QMainWindow):
         # Otherwise show preferences
         self.preference_panel.set_video(path)
 
+    @staticmethod
+    def _file_signature(path: str):
+        """(mtime_ns, size) identifying one version of a file, or None."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _cached_video_info(self, path: str):
+        """The last probe result if `path` is that same, unchanged file."""
+        last = self._last_video_info
+        if last is None or last[0] != path:
+            return None
+        signature = self._file_signature(path)
+        return last[2] if signature is not None and signature == last[1] else None
+    
+    def _probe_video_info(self, path: str):
+        """Worker thread: run ffprobe and hand the result to the UI thread."""
+        signature = self._file_signature(path)
+        info = get_video_info(path)
+        if info is not None and signature is not None:
+            self._last_video_info = (path, signature, info)
+        self.video_info_ready.emit(path, info)
+    
+    @Slot(str, object)
+    def on_video_info_ready(self, path: str, info):
+        """Display probed video info unless another file was opened since."""
+        if path != getattr(self, '_info_probe_path', None):
+            return
+        if info and hasattr(self, 'video_info_bar'):
+            self.video_info_bar.set_info(info)
+
     def _on_detection_changed(self):
         """Called when detection added/removed/edited"""
         self.detections_modified = True
@@ -2285,13 +2671,50 @@ class MainWindow(QMainWindow):
         # Save quality settings to config before processing
         self._save_output_settings()
         
+        # Add to queue
+        self.processing_queue.add(self._build_queue_item(video_path, settings, profile_name, scheduled_time))
+        self.queue_panel.refresh()
+        
+        # Save queue state for crash recovery
+        self.processing_queue.save_state()
+        
+        # Start processing if not scheduled and not already busy
+        if not scheduled_time:
+            if not self.processing:
+                self._process_next()
+        else:
+            # Confirm schedule
+            from PySide6.QtWidgets import QMessageBox
+            time_str = scheduled_time.strftime('%I:%M %p')
+            QMessageBox.information(self, "Job Scheduled", f"Video has been scheduled for {time_str}")
+    
+    def _enqueue_videos(self, video_paths: list):
+        """Queue several videos at once with the current profile's settings."""
+        self._save_output_settings()
+        
+        settings = self.preference_panel.get_current_settings()
+        profile_name = self.preference_panel.profile_combo.currentText()
+        for video_path in video_paths:
+            add_recent_file(video_path)
+            self.processing_queue.add(self._build_queue_item(video_path, settings, profile_name))
+        if hasattr(self, 'recent_menu'):
+            self._update_recent_menu()
+        
+        # One refresh, one state save and at most one start for the whole batch
+        self.queue_panel.refresh()
+        self.processing_queue.save_state()
+        if not self.processing:
+            self._process_next()
+    
+    def _build_queue_item(self, video_path: str, settings: ContentFilterSettings, profile_name: str, scheduled_time=None) -> QueueItem:
+        """Create the queue item for one video, picking up resumable analysis and subtitles."""
         # Create output path
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         video_path_obj = Path(video_path)
         
         # Get selected output format from MainWindow's dropdown
         output_format = self.format_combo.currentText()
-        output_path = Path(OUTPUT_DIR) / f"{video_path_obj.stem}.CENSORED.{output_format}"
+        output_path = OUTPUT_DIR_PATH / f"{video_path_obj.stem}.CENSORED.{output_format}"
         
         status = "scheduled" if scheduled_time else "pending"
         
@@ -2325,23 +2748,7 @@ class MainWindow(QMainWindow):
         # Manually attach subtitle path (dynamically added attribute)
         if sub_path:
             item.subtitles_path = sub_path
-        
-        # Add to queue
-        self.processing_queue.add(item)
-        self.queue_panel.refresh()
-        
-        # Save queue state for crash recovery
-        self.processing_queue.save_state()
-        
-        # Start processing if not scheduled and not already busy
-        if not scheduled_time:
-            if not self.processing:
-                self._process_next()
-        else:
-            # Confirm schedule
-            from PySide6.QtWidgets import QMessageBox
-            time_str = scheduled_time.strftime('%I:%M %p')
-            QMessageBox.information(self, "Job Scheduled", f"Video has been scheduled for {time_str}")
+        return item
     
     def _process_next(self):
         # Check if processing is paused
@@ -2382,13 +2789,11 @@ class MainWindow(QMainWindow):
         self.processing = True
         self.current_item = item
         item.start_processing()
-        self.queue_panel.refresh()
+        self.queue_panel.update_item_status(item.id)
         self.status_label.setText("Processing...")
         
         # Run in background thread
-        thread = threading.Thread(target=self._run_censor, args=(item,))
-        thread.daemon = True
-        thread.start()
+        self._start_censor_thread(item)
         
     def _check_scheduled_items(self):
         """Check for scheduled items that are due."""
@@ -2408,13 +2813,46 @@ class MainWindow(QMainWindow):
             if not self.processing:
                 self._process_next()
     
+    def _report_progress(self, item_id: str, progress: float, status: str):
+        """Worker thread: hand a progress update to the UI thread's pump."""
+        self._progress_q.put((item_id, progress, status))
+    
+    def _drain_progress(self):
+        """Apply queued progress updates, keeping only the latest per item."""
+        future = self._censor_future
+        finished = future is None or future.done()
+        
+        latest = {}
+        try:
+            while True:
+                item_id, progress, status = self._progress_q.get_nowait()
+                latest[item_id] = (progress, status)
+        except queue.Empty:
+            pass
+        
+        for item_id, (progress, status) in latest.items():
+            self.on_progress_update(item_id, progress, status)
+        
+        # Checked before draining, so nothing the worker queued can be left behind
+        if finished:
+            self._progress_pump.stop()
+    
+    def _start_censor_thread(self, item: QueueItem):
+        """Run _run_censor for an item on the censor worker, pumping its progress."""
+        # Jobs started by timers or the schedule skip the Start click's save;
+        # queue a settings change still waiting on the debounce so the worker's
+        # wait_for_config_write() covers it
+        self.preference_panel.flush_pending_save(wait=False)
+        self._censor_future = self._censor_pool.submit(self._run_censor, item)
+        self._progress_pump.start()
+    
     @Slot(str, float, str)
     def on_progress_update(self, item_id: str, progress: float, status: str):
-        """Handle progress updates from background thread."""
+        """Apply a progress update from the background thread."""
         item = self.processing_queue.get(item_id)
         if item:
             item.update_progress(progress, status)
-            self.queue_panel.update_item(item_id)
+            self.queue_panel.schedule_item_update(item_id)
             
             # Check for progress notifications (50% and 90%)
             self._check_progress_notification(item)
@@ -2488,20 +2926,18 @@ class MainWindow(QMainWindow):
         self.stack.setCurrentIndex(0) 
         
         # Resume processing
-        self.queue_panel.refresh()
+        self.queue_panel.update_item_status(item.id)
         self.status_label.setText("Processing...")
         self.processing = True
         
         # Run export in background thread
-        thread = threading.Thread(target=self._run_censor, args=(item,))
-        thread.daemon = True
-        thread.start()
+        self._start_censor_thread(item)
 
     def _on_review_cancelled(self):
         """User cancelled review."""
         if self.current_item:
             self.current_item.cancel()
-            self.queue_panel.refresh()
+            self.queue_panel.update_item_status(self.current_item.id)
             
         self.stack.setCurrentIndex(0)
         self.processing = False
@@ -2511,6 +2947,17 @@ class MainWindow(QMainWindow):
         # Process next
         QTimer.singleShot(100, self._process_next)
     
+    def _get_editor_panel(self):
+        """Return the editor page (stack index 2), creating it on first use."""
+        if self.editor_panel is None:
+            from .editor_panel import EditorPanel
+            self.editor_panel = EditorPanel()
+            self.editor_panel.export_requested.connect(self._on_editor_export)
+            self.editor_panel.close_requested.connect(self._on_editor_closed)
+            self.editor_panel.edit_created.connect(self._on_edit_created)
+            self.stack.addWidget(self.editor_panel)
+        return self.editor_panel
+    
     def _on_editor_requested(self):
         """User wants to open the Timeline Editor."""
         if not self.current_item:
@@ -2533,7 +2980,7 @@ class MainWindow(QMainWindow):
             
             # Load into editor panel
             from pathlib import Path
-            self.editor_panel.load_video(Path(item.input_path), data, duration)
+            self._get_editor_panel().load_video(Path(item.input_path), data, duration)
             self.stack.setCurrentIndex(2)  # Switch to editor
             self.status_label.setText("✂️ Editing...")
             
@@ -2546,7 +2993,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'review_panel') and self.review_panel:
             count = self.review_panel.mark_covered_by_edit(start, end)
             if count > 0:
-                logging.info(f"Marked {count} detection(s) as covered by edit [{start:.2f}s - {end:.2f}s]")
+                logger.info("Marked %d detection(s) as covered by edit [%.2fs - %.2fs]", count, start, end)
     
     def _on_editor_export(self, project):
         """Handle export from editor."""
@@ -2594,13 +3041,10 @@ class MainWindow(QMainWindow):
         # Update item status and start export
         item.status = "exporting"
         item.progress = 0.5
-        self.queue_panel.refresh()
+        self.queue_panel.update_item_status(item.id)
         
         # Run export in background
-        import threading
-        thread = threading.Thread(target=self._run_censor, args=(item,))
-        thread.daemon = True
-        thread.start()
+        self._start_censor_thread(item)
     
     def _on_editor_closed(self):
         """User closed the editor without exporting."""
@@ -2639,6 +3083,7 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def on_item_review_ready(self, item_id: str):
         """Handle item ready for review."""
+        self._drain_progress()  # Progress reported before the result goes first
         item = self.processing_queue.get(item_id)
         if item:
             self.queue_panel.update_item(item_id)
@@ -2668,9 +3113,10 @@ class MainWindow(QMainWindow):
             # Kill subprocess if running
             if self.current_process:
                 try:
-                    self.current_process.terminate()
+                    # Also stops the reader thread, even if the worker has hung
+                    self.censor_daemon.cancel()
                     # Give it a moment to die gracefully
-                    QTimer.singleShot(1000, lambda: self._force_kill_if_needed())
+                    QTimer.singleShot(1000, self._force_kill_if_needed)
                 except Exception as e:
                     print(f"Error terminating process: {e}")
             
@@ -2705,7 +3151,7 @@ class MainWindow(QMainWindow):
                 # Kill current subprocess
                 if self.current_process:
                     try:
-                        self.current_process.terminate()
+                        self.censor_daemon.cancel()
                         try:
                             self.current_process.wait(timeout=2)
                         except:
@@ -2731,6 +3177,7 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def on_item_complete(self, item_id: str):
         """Handle item completion."""
+        self._drain_progress()
         item = self.processing_queue.get(item_id)
         if item:
             item.complete()
@@ -2749,13 +3196,13 @@ class MainWindow(QMainWindow):
             self.last_output_path = item.output_path
             
             # Show "Show in Folder" dialog on main thread
-            QTimer.singleShot(100, lambda: self._show_export_complete_dialog(item.output_path))
+            QTimer.singleShot(100, functools.partial(self._show_export_complete_dialog, item.output_path))
             
             # Save queue state (remove completed from persistence)
             self.processing_queue.save_state()
             
             # Auto-clear this item after 30 seconds to free memory
-            QTimer.singleShot(30000, lambda: self._auto_clear_item(item_id))
+            QTimer.singleShot(30000, functools.partial(self._auto_clear_item, item_id))
             
             # Check if batch is done (trigger notifications/sleep)
             self.processing_queue.check_all_complete()
@@ -2865,6 +3312,7 @@ class MainWindow(QMainWindow):
     @Slot(str, str)
     def on_item_failed(self, item_id: str, error: str):
         """Handle item failure."""
+        self._drain_progress()
         item = self.processing_queue.get(item_id)
         if item:
             item.fail(error)
@@ -2902,19 +3350,9 @@ class MainWindow(QMainWindow):
 
             log_debug(f"Starting _run_censor for item {item.id}")
             
-            try:
-                log_debug(f"File: {__file__}")
-                project_root = Path(__file__).resolve().parent.parent
-                log_debug(f"Root: {project_root}")
-                
-                VENV_PYTHON = str(project_root / "venv" / "bin" / "python")
-                CENSOR_SCRIPT = str(project_root / "censor_video.py")
-                
-                log_debug(f"Python: {VENV_PYTHON}")
-                log_debug(f"Script: {CENSOR_SCRIPT}")
-            except Exception as e:
-                log_debug(f"Error resolving paths: {e}")
-                raise e
+            log_debug(f"Root: {PROJECT_ROOT}")
+            log_debug(f"Python: {VENV_PYTHON}")
+            log_debug(f"Script: {CENSOR_SCRIPT}")
             
             if not os.path.exists(VENV_PYTHON):
                 log_debug(f"ERROR: VENV_PYTHON not found at {VENV_PYTHON}")
@@ -2926,14 +3364,12 @@ class MainWindow(QMainWindow):
                 self.item_failed.emit(item.id, f"Script not found: {CENSOR_SCRIPT}")
                 return
             
-            env = os.environ.copy()
-            env["PATH"] = f"/opt/homebrew/bin:{env.get('PATH', '')}"
-            env["PYTHONUNBUFFERED"] = "1"  # Force unbuffered output
+            # censor_video.py reads config.yaml; let a write started by the
+            # Start click land first
+            self.preference_panel.wait_for_config_write()
             
+            # censor_video.py arguments; the script itself runs in the daemon
             cmd = [
-                "arch", "-arm64", # Explicitly force arm64 to match venv libraries
-                VENV_PYTHON, "-u",
-                CENSOR_SCRIPT,
                 str(item.input_path), str(item.output_path),
                 "--save-summary", str(item.output_path.with_suffix('.json')),
                 "-y"
@@ -2963,37 +3399,29 @@ class MainWindow(QMainWindow):
                 
                 # Update item state
                 item.analysis_path = analysis_path
-                self.progress_update.emit(item.id, 0.01, "Starting analysis...")
+                self._report_progress(item.id, 0.01, "Starting analysis...")
                 
             elif item.status == "exporting":
                  # Run Import & Render
                  if item.analysis_path and item.analysis_path.exists():
                      cmd.extend(["--import-intervals", str(item.analysis_path)])
-                     self.progress_update.emit(item.id, 0.50, "Starting export...")
+                     self._report_progress(item.id, 0.50, "Starting export...")
                  else:
                      self.item_failed.emit(item.id, "Missing analysis file for export")
                      return
             
-            if not item.filters.filter_language:
-                cmd.append("--no-profanity")
-            if not item.filters.filter_nudity:
-                cmd.append("--no-nudity")
-            
-            # Start process
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                env=env,
-                universal_newlines=True,
-                bufsize=1
-            )
+            cmd.extend(_FILTER_FLAGS[bool(item.filters.filter_language), bool(item.filters.filter_nudity)])
+            
+            # Hand the job to the persistent worker (started on first use)
+            if self.censor_daemon is None:
+                self.censor_daemon = CensorDaemon(list(CENSOR_DAEMON_CMD))
+            process = self.censor_daemon.start_job(cmd, self._child_env)
             
             # Store reference in main window for cancellation
             self.current_process = process
             
             # Log file for debugging - Open ONCE instead of per-line
-            debug_log = Path(__file__).parent.parent / "ui_debug.log"
+            debug_log = UI_DEBUG_LOG
             
             # Rate limiting for progress updates
             import time
@@ -3002,15 +3430,10 @@ class MainWindow(QMainWindow):
             
             # Read output
             with open(debug_log, "a") as log_file:
-                while True:
-                    line = process.stdout.readline()
-                    if not line and process.poll() is not None:
-                        break
-                        
+                for line in self.censor_daemon.iter_output():
+                    line = line.strip()
                     if not line:
                         continue
-                        
-                    line = line.strip()
                     
                     # Log to file efficiently
                     log_file.write(f"[PIPE] {line}\n")
@@ -3021,11 +3444,16 @@ class MainWindow(QMainWindow):
                     current_time = time.time()
                     should_emit = (current_time - last_progress_emit) > progress_emit_interval
                     
+                    # Only a handful of lines per job carry a STEP marker; a
+                    # substring test spares the regex on all the others
+                    step = _STEP_RE.search(line) if "STEP" in line else None
+                    
                     if is_analysis_pass:
                         # Analysis Phases (0-50%)
-                        if "STEP 1" in line:
-                             self.progress_update.emit(item.id, 0.05, "Starting parallel analysis...")
-                             last_progress_emit = current_time
+                        if step and step.group(1) in _ANALYSIS_STEPS:
+                            progress, message = _ANALYSIS_STEPS[step.group(1)]
+                            self._report_progress(item.id, progress, message)
+                            last_progress_emit = current_time
                         
                         # Parallel Progress Parsing
                         elif "[AUDIO] PROGRESS:" in line:
@@ -3038,7 +3466,7 @@ class MainWindow(QMainWindow):
                                 
                                 if should_emit or pct >= 100:
                                     msg = f"Analyzing: Audio {int(item.audio_progress)}% | Video {int(item.video_progress)}%"
-                                    self.progress_update.emit(item.id, combined, msg)
+                                    self._report_progress(item.id, combined, msg)
                                     last_progress_emit = current_time
                             except:
                                 pass
@@ -3053,57 +3481,47 @@ class MainWindow(QMainWindow):
                                 
                                 if should_emit or pct >= 100:
                                     msg = f"Analyzing: Audio {int(item.audio_progress)}% | Video {int(item.video_progress)}%"
-                                    self.progress_update.emit(item.id, combined, msg)
+                                    self._report_progress(item.id, combined, msg)
                                     last_progress_emit = current_time
                             except:
                                 pass
-                    
-                    elif "STEP 2.5" in line:
-                         self.progress_update.emit(item.id, 0.50, "Sexual content detection...")
-                    elif "STEP 2.7" in line:
-                         self.progress_update.emit(item.id, 0.51, "Violence detection...")
-                    elif "STEP 3" in line:
-                         self.progress_update.emit(item.id, 0.52, "Planning edits...")
-
-
-
-                    elif "Analysis complete" in line:
-                        self.progress_update.emit(item.id, 0.50, "Analysis complete")
                         
-                else:
-                    # Export Phases (50-100%)
-                    if "STEP 3" in line:
-                        self.progress_update.emit(item.id, 0.55, "Planning edits...")
-                    elif "STEP 4" in line:
-                        self.progress_update.emit(item.id, 0.60, "Rendering video...")
-                    elif "Extracting" in line and "segments" in line:
-                        # Parse segment count for progress base
-                        try:
-                            parts = line.split()
-                            for i, p in enumerate(parts):
-                                if p == "Extracting" and i+1 < len(parts):
-                                    self._total_segments = int(parts[i+1])
-                                    self._current_segment = 0
-                                    break
-                        except: pass
-                    elif "Extracted segment" in line or "stream-copy" in line or "copy-video" in line or "hw-encode" in line:
-                        # Each segment extraction
-                        self._current_segment = getattr(self, '_current_segment', 0) + 1
-                        total_segs = getattr(self, '_total_segments', 50)
-                        # Map segments to 60-90% range
-                        pct = 0.60 + (self._current_segment / total_segs) * 0.30
-                        self.progress_update.emit(item.id, min(pct, 0.90), f"Extracting segment {self._current_segment}/{total_segs}...")
-                    elif "Concatenating" in line:
-                        self.progress_update.emit(item.id, 0.92, "Stitching segments...")
-                    elif "Concatenated" in line:
-                        self.progress_update.emit(item.id, 0.95, "Finalizing...")
-                    elif "Complete" in line or "SUCCESS" in line or "saved to" in line.lower():
-                        self.progress_update.emit(item.id, 1.0, "Complete")
+                        elif "Analysis complete" in line:
+                            self._report_progress(item.id, 0.50, "Analysis complete")
+                        
+                    else:
+                        # Export Phases (50-100%)
+                        if step and step.group(1) in _EXPORT_STEPS:
+                            progress, message = _EXPORT_STEPS[step.group(1)]
+                            self._report_progress(item.id, progress, message)
+                        elif "Extracting" in line and "segments" in line:
+                            # Parse segment count for progress base
+                            try:
+                                parts = line.split()
+                                for i, p in enumerate(parts):
+                                    if p == "Extracting" and i+1 < len(parts):
+                                        self._total_segments = int(parts[i+1])
+                                        self._current_segment = 0
+                                        break
+                            except: pass
+                        elif "Extracted segment" in line or "stream-copy" in line or "copy-video" in line or "hw-encode" in line:
+                            # Each segment extraction
+                            self._current_segment = getattr(self, '_current_segment', 0) + 1
+                            total_segs = getattr(self, '_total_segments', 50)
+                            # Map segments to 60-90% range
+                            pct = 0.60 + (self._current_segment / total_segs) * 0.30
+                            self._report_progress(item.id, min(pct, 0.90), f"Extracting segment {self._current_segment}/{total_segs}...")
+                        elif "Concatenating" in line:
+                            self._report_progress(item.id, 0.92, "Stitching segments...")
+                        elif "Concatenated" in line:
+                            self._report_progress(item.id, 0.95, "Finalizing...")
+                        elif "Complete" in line or "SUCCESS" in line or "saved to" in line.lower():
+                            self._report_progress(item.id, 1.0, "Complete")
             
             # Clear process reference when done
             self.current_process = None
 
-            rc = process.poll()
+            rc = self.censor_daemon.returncode
             
             if rc == 0:
                 if is_analysis_pass:
@@ -3121,14 +3539,13 @@ class MainWindow(QMainWindow):
             import traceback
             traceback.print_exc()
             try:
-                with open(Path(__file__).parent.parent / "ui_debug.log", "a") as f:
+                with open(UI_DEBUG_LOG, "a") as f:
                     f.write(f"[CRITICAL] {str(e)}\n")
             except:
                 pass
             self.item_failed.emit(item.id, str(e))
     
     def _open_profile_manager(self):
-        from .profile_dialog import ProfileDialog
         dialog = ProfileDialog(self.profile_manager, self)
         dialog.exec()
         self.preference_panel.refresh_profiles()
@@ -3160,7 +3577,7 @@ class MainWindow(QMainWindow):
             sync_presets(config)
             
             # Update UI if alive
-            QTimer.singleShot(0, lambda: self._on_auto_sync_complete())
+            QTimer.singleShot(0, self._on_auto_sync_complete)
         except Exception as e:
             print(f"Auto-sync error: {e}")
 
@@ -3176,7 +3593,9 @@ class MainWindow(QMainWindow):
         # Stop any running processing
         if self.current_process:
             try:
-                self.current_process.terminate()
+                # Cancel through the daemon so the censor worker thread
+                # returns and doesn't hold up interpreter exit
+                self.censor_daemon.cancel()
                 self.current_process.wait(timeout=2)
             except:
                 try:
@@ -3185,6 +3604,14 @@ class MainWindow(QMainWindow):
                     pass
             self.current_process = None
         
+        # Don't lose a settings change made just before quitting
+        self.preference_panel.flush_pending_save()
+        
+        # Let an idle worker exit
+        self._censor_pool.shutdown(wait=False, cancel_futures=True)
+        if self.censor_daemon:
+            self.censor_daemon.stop()
+        
         # Clean up detection browser hover preview
         if hasattr(self, 'detection_browser') and hasattr(self.detection_browser, 'hover_preview'):
             try:
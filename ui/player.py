@@ -9,7 +9,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
-from PySide6.QtCore import Qt, Signal, QUrl, QTime
+from PySide6.QtCore import Qt, Signal, QUrl, QTime, QTimer
 from PySide6.QtGui import QKeyEvent
 
 class VideoPlayerWidget(QWidget):
@@ -24,6 +24,7 @@ class VideoPlayerWidget(QWidget):
     # Keyboard shortcuts
     FRAME_STEP_MS = 42  # ~1 frame at 24fps
     SHUTTLE_STEP_MS = 5000  # 5 seconds for J/L keys
+    SCRUB_SEEK_MS = 30  # Minimum interval between seeks while dragging
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -103,9 +104,16 @@ class VideoPlayerWidget(QWidget):
         # Seek Slider
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setRange(0, 0)
-        self.slider.sliderMoved.connect(self.set_position)
+        self.slider.sliderMoved.connect(self._on_slider_moved)
         self.slider.sliderPressed.connect(self.media_player.pause)
-        self.slider.sliderReleased.connect(self.media_player.play)
+        self.slider.sliderReleased.connect(self._on_slider_released)
+        
+        # sliderMoved fires per pixel; coalesce drag seeks onto a short timer
+        self._pending_seek = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(self.SCRUB_SEEK_MS)
+        self._seek_timer.timeout.connect(self._apply_pending_seek)
         controls_layout.addWidget(self.slider)
         
         # Time Label (Total)
@@ -219,6 +227,24 @@ class VideoPlayerWidget(QWidget):
         """Seek to position in ms."""
         self.media_player.setPosition(position)
     
+    def _on_slider_moved(self, position: int):
+        """Track the drag position, seeking at most once per SCRUB_SEEK_MS."""
+        self._pending_seek = position
+        self.time_label.setText(self._format_time(position))
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+    
+    def _apply_pending_seek(self):
+        if self._pending_seek is not None:
+            self.set_position(self._pending_seek)
+            self._pending_seek = None
+    
+    def _on_slider_released(self):
+        # Land exactly where the drag ended before resuming
+        self._seek_timer.stop()
+        self._apply_pending_seek()
+        self.media_player.play()
+    
     def _on_speed_changed(self, speed_text: str):
         """Handle playback speed change."""
         speed = float(speed_text.replace("x", ""))
@@ -2,32 +2,18 @@
 Search Tab for querying the Cloud Database.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QScrollArea, QFrame, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QColor
 
 from video_censor.cloud_db import get_cloud_client
 
-class SearchWorker(QThread):
-    """Background thread for executing searches."""
-    finished = Signal(list)
-    error = Signal(str)
-
-    def __init__(self, query: str):
-        super().__init__()
-        self.query = query
-
-    def run(self):
-        try:
-            client = get_cloud_client()
-            results = client.search_videos(self.query)
-            self.finished.emit(results)
-        except Exception as e:
-            self.error.emit(str(e))
-
 class SearchResultWidget(QFrame):
     """Widget displaying a single search result."""
     
@@ -41,14 +27,13 @@ class SearchResultWidget(QFrame):
         
         # Header: Title + Date
         header = QHBoxLayout()
-        title = QLabel(data.get('title', 'Unknown'))
-        title.setStyleSheet("font-size: 14px; font-weight: bold; color: white; background: transparent;")
-        header.addWidget(title)
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("font-size: 14px; font-weight: bold; color: white; background: transparent;")
+        header.addWidget(self.title_label)
         
-        date_str = data.get('created_at', '')[:10]
-        date_lbl = QLabel(date_str)
-        date_lbl.setStyleSheet("color: #71717a; font-size: 11px; background: transparent;")
-        header.addWidget(date_lbl)
+        self.date_label = QLabel()
+        self.date_label.setStyleSheet("color: #71717a; font-size: 11px; background: transparent;")
+        header.addWidget(self.date_label)
         
         layout.addLayout(header)
         
@@ -56,17 +41,10 @@ class SearchResultWidget(QFrame):
         stats = QHBoxLayout()
         stats.setSpacing(16)
         
-        nudity_count = len(data.get('nudity_segments', []) or [])
-        profanity_count = len(data.get('profanity_segments', []) or [])
-        sexual_count = len(data.get('sexual_content_segments', []) or [])
-        violence_count = len(data.get('violence_segments', []) or [])
-        
-        self._add_stat(stats, "Nudity", nudity_count, "#f43f5e" if nudity_count > 0 else "#22c55e")
-        self._add_stat(stats, "Profanity", profanity_count, "#fbbf24" if profanity_count > 0 else "#22c55e")
-        self._add_stat(stats, "Sexual", sexual_count, "#d946ef" if sexual_count > 0 else "#22c55e")
-        # Violence is optional/beta, usually huge numbers
-        if violence_count > 0:
-            self._add_stat(stats, "Violence", violence_count, "#ef4444")
+        self.nudity_stat = self._add_stat(stats)
+        self.profanity_stat = self._add_stat(stats)
+        self.sexual_stat = self._add_stat(stats)
+        self.violence_stat = self._add_stat(stats)
             
         stats.addStretch()
         layout.addLayout(stats)
@@ -74,11 +52,37 @@ class SearchResultWidget(QFrame):
         # Timeline (Lazy loaded)
         self.timeline_container = QWidget()
         self.timeline_container.hide()
+        self.timeline = None
         layout.addWidget(self.timeline_container)
         
+        self.set_data(data)
+    
+    def set_data(self, data: dict):
+        """Show another result in this widget (collapsed)."""
         self.data = data
         self.is_expanded = False
+        self.timeline_container.hide()
+        if self.timeline is not None:
+            # Built for the previous result; rebuilt lazily on next expand
+            self.timeline.deleteLater()
+            self.timeline = None
+        self.setStyleSheet("background: #181820; border-radius: 8px;")
+        
+        self.title_label.setText(data.get('title', 'Unknown'))
+        self.date_label.setText(data.get('created_at', '')[:10])
+        
+        nudity_count = len(data.get('nudity_segments', []) or [])
+        profanity_count = len(data.get('profanity_segments', []) or [])
+        sexual_count = len(data.get('sexual_content_segments', []) or [])
+        violence_count = len(data.get('violence_segments', []) or [])
         
+        self._set_stat(self.nudity_stat, "Nudity", nudity_count, "#f43f5e" if nudity_count > 0 else "#22c55e")
+        self._set_stat(self.profanity_stat, "Profanity", profanity_count, "#fbbf24" if profanity_count > 0 else "#22c55e")
+        self._set_stat(self.sexual_stat, "Sexual", sexual_count, "#d946ef" if sexual_count > 0 else "#22c55e")
+        # Violence is optional/beta, usually huge numbers
+        self._set_stat(self.violence_stat, "Violence", violence_count, "#ef4444")
+        self.violence_stat.setVisible(violence_count > 0)
+            
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._toggle_expand()
@@ -87,13 +91,15 @@ class SearchResultWidget(QFrame):
         self.is_expanded = not self.is_expanded
         
         if self.is_expanded:
-            if not self.timeline_container.layout():
+            if self.timeline is None:
                 # Lazy load timeline
                 from .timeline import TimelineWidget
-                tl_layout = QVBoxLayout(self.timeline_container)
-                tl_layout.setContentsMargins(0, 10, 0, 0)
+                tl_layout = self.timeline_container.layout()
+                if tl_layout is None:
+                    tl_layout = QVBoxLayout(self.timeline_container)
+                    tl_layout.setContentsMargins(0, 10, 0, 0)
                 
-                timeline = TimelineWidget()
+                self.timeline = TimelineWidget()
                 
                 # Format data
                 duration = self.data.get('duration_seconds', 0)
@@ -104,27 +110,41 @@ class SearchResultWidget(QFrame):
                     'violence': self.data.get('violence_segments'),
                 }
                 
-                timeline.set_data(duration, formatted_data)
-                tl_layout.addWidget(timeline)
+                self.timeline.set_data(duration, formatted_data)
+                tl_layout.addWidget(self.timeline)
                 
             self.timeline_container.show()
             self.setStyleSheet("background: #20202a; border-radius: 8px; border: 1px solid #3b82f6;")
         else:
             self.timeline_container.hide()
             self.setStyleSheet("background: #181820; border-radius: 8px;")
-    def _add_stat(self, layout, label, count, color):
-        lbl = QLabel(f"{label}: {count}")
-        lbl.setStyleSheet(f"color: {color}; font-weight: 600; font-size: 12px; background: transparent;")
+    
+    def _add_stat(self, layout) -> QLabel:
+        lbl = QLabel()
         layout.addWidget(lbl)
+        return lbl
+    
+    def _set_stat(self, lbl, label, count, color):
+        lbl.setText(f"{label}: {count}")
+        lbl.setStyleSheet(f"color: {color}; font-weight: 600; font-size: 12px; background: transparent;")
 
 
 class SearchTab(QWidget):
     """Tab for searching the cloud database."""
     
+    # Shared, bounded pool so repeated searches reuse threads
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+    
+    # Emitted from the pool thread; delivered on the UI thread
+    search_finished = Signal(object, list)  # future, results
+    search_failed = Signal(object, str)  # future, error
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
-        self.current_worker = None
+        self._search_future: Optional[Future] = None
+        self.search_finished.connect(self._on_search_finished)
+        self.search_failed.connect(self._on_search_error)
         
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -193,7 +213,14 @@ class SearchTab(QWidget):
         self.results_container = QWidget()
         self.results_layout = QVBoxLayout(self.results_container)
         self.results_layout.setSpacing(12)
+        
+        # Status/empty-state message, created once and reused for every search
+        self.message_label = QLabel()
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setStyleSheet("color: #71717a; font-size: 14px; padding: 40px;")
+        self.results_layout.addWidget(self.message_label)
         self.results_layout.addStretch()
+        self._result_widgets = []  # Pool of result cards, reused across searches
         
         self.scroll.setWidget(self.results_container)
         layout.addWidget(self.scroll)
@@ -220,12 +247,31 @@ class SearchTab(QWidget):
         self._clear_results()
         self._show_message("Searching cloud database...")
         
-        self.current_worker = SearchWorker(query)
-        self.current_worker.finished.connect(self._on_search_finished)
-        self.current_worker.error.connect(self._on_search_error)
-        self.current_worker.start()
+        # Drop any search that hasn't started yet; only the latest one counts
+        if self._search_future and not self._search_future.done():
+            self._search_future.cancel()
+        
+        self._search_future = self._executor.submit(self._run_search, query)
+        self._search_future.add_done_callback(self._on_search_done)
+    
+    @staticmethod
+    def _run_search(query: str) -> list:
+        """Worker thread: query the cloud database."""
+        return get_cloud_client().search_videos(query)
+    
+    def _on_search_done(self, future: Future):
+        """Pool thread: forward the outcome to the UI thread."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.search_failed.emit(future, str(error))
+        else:
+            self.search_finished.emit(future, future.result())
         
-    def _on_search_finished(self, results):
+    def _on_search_finished(self, future, results):
+        if future is not self._search_future:
+            return  # Superseded by a newer search
         self.search_input.setEnabled(True)
         self.search_btn.setEnabled(True)
         self._clear_results()
@@ -234,41 +280,38 @@ class SearchTab(QWidget):
             self._show_message(f"No results found for '{self.search_input.text()}'.")
             return
             
-        # Add results
-        # Remove the stretch item at the end first
-        self._remove_stretch()
-            
-        for data in results:
-            widget = SearchResultWidget(data)
-            self.results_layout.addWidget(widget)
-            
-        self.results_layout.addStretch()
+        # Build every card before the container relayouts/repaints once
+        self.results_container.setUpdatesEnabled(False)
+        try:
+            # Reuse cards from earlier searches; only create what's missing
+            for i, data in enumerate(results):
+                if i < len(self._result_widgets):
+                    widget = self._result_widgets[i]
+                    widget.set_data(data)
+                else:
+                    widget = SearchResultWidget(data)
+                    self._result_widgets.append(widget)
+                    # Keep the trailing stretch last
+                    self.results_layout.insertWidget(self.results_layout.count() - 1, widget)
+                widget.show()
+        finally:
+            self.results_container.setUpdatesEnabled(True)
         
-    def _on_search_error(self, error):
+    def _on_search_error(self, future, error):
+        if future is not self._search_future:
+            return
         self.search_input.setEnabled(True)
         self.search_btn.setEnabled(True)
         self._clear_results()
         self._show_message(f"Error: {error}")
         
     def _clear_results(self):
-        # Remove all widgets from layout
-        while self.results_layout.count():
-            item = self.results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                # self._clear_layout(item.layout())
-                pass
+        # Hide result cards (kept for reuse); the message label and stretch stay
+        for widget in self._result_widgets:
+            widget.hide()
+        self.message_label.hide()
                 
     def _show_message(self, text):
         self._clear_results()
-        lbl = QLabel(text)
-        lbl.setAlignment(Qt.AlignCenter)
-        lbl.setStyleSheet("color: #71717a; font-size: 14px; padding: 40px;")
-        self.results_layout.addWidget(lbl)
-        self.results_layout.addStretch()
-        
-    def _remove_stretch(self):
-        # A simple hack to remove the last stretch item if present is tricky without logic
-        # But _clear_results removes everything anyway, so we are fine.
-        pass
+        self.message_label.setText(text)
+        self.message_label.show()
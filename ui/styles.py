@@ -610,4 +610,19 @@ QLabel[class="pref-section-title"] {
     margin-bottom: 8px;
 }
 
+/* Shared preference card widgets (styled once here, not per widget) */
+QLabel[class="card-title"] {
+    font-size: 11px;
+    font-weight: 600;
+    color: #a0a0b0;
+}
+QCheckBox[class="card-option"] {
+    color: #b0b0c0;
+    font-size: 11px;
+}
+QCheckBox[class="card-option-small"] {
+    color: #b0b0c0;
+    font-size: 10px;
+}
+
 """
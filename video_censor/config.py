@@ -5,6 +5,9 @@ Loads settings from YAML config file with sensible defaults.
 """
 
 import logging
+import os
+import stat
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -13,6 +16,10 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class DetectionCacheConfig:
@@ -271,7 +278,7 @@ class Config:
             config._path = config_path  # Store path for save()
             logger.info(f"Loading configuration from {config_path}")
             with open(config_path, 'r') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
             
             # Update profanity config
             if 'profanity' in data:
@@ -370,8 +377,6 @@ class Config:
 
     def save(self, config_path: Optional[Path] = None) -> None:
         """Save configuration to YAML file."""
-        from dataclasses import asdict
-        
         # Use provided path, or stored path, or default
         target_path = config_path or self._path
         
@@ -382,12 +387,45 @@ class Config:
         # Update stored path
         self._path = target_path
         
+        logger.info(f"Saving configuration to {target_path}")
+        write_config_text(target_path, self.to_yaml())
+    
+    def to_yaml(self) -> str:
+        """Serialize the configuration (minus internal fields) to YAML."""
+        from dataclasses import asdict
+        
         # Exclude internal fields
         data = asdict(self)
         if "_path" in data:
             del data["_path"]
-            
-        logger.info(f"Saving configuration to {target_path}")
         
-        with open(target_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False)
+        return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False)
+
+
+def write_config_text(config_path: Path, text: str) -> None:
+    """
+    Atomically replace a config file with already-serialized YAML.
+    
+    The text goes to a temporary file beside the target first, so readers
+    (and an interrupted write) never see a half-written config. Each call
+    gets its own temporary file, so concurrent writers can't clobber one
+    another's before the rename.
+    """
+    config_path = Path(config_path)
+    try:
+        mode = stat.S_IMODE(os.stat(config_path).st_mode)
+    except OSError:
+        mode = 0o644
+    
+    tmp = tempfile.NamedTemporaryFile(
+        'w', dir=config_path.parent, prefix=config_path.name + ".", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(text)
+        # NamedTemporaryFile creates 0600 files; keep the config's own mode
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, config_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
@@ -90,7 +90,7 @@ class DTDDUsageTracker:
                 
                 self._usage.update(saved)
             except Exception as e:
-                logger.warning(f"Failed to load DTDD usage data: {e}")
+                logger.warning("Failed to load DTDD usage data: %s", e)
     
     def _save_usage(self):
         """Save usage data to file."""
@@ -98,7 +98,7 @@ class DTDDUsageTracker:
             with open(self.usage_file, 'w') as f:
                 json.dump(self._usage, f, indent=2)
         except Exception as e:
-            logger.warning(f"Failed to save DTDD usage data: {e}")
+            logger.warning("Failed to save DTDD usage data: %s", e)
     
     def record_request(self):
         """Record an API request."""
@@ -199,7 +199,7 @@ class DoesTheDogDieClient:
         """Make a rate-limited API request."""
         can_request, reason = self._usage_tracker.can_make_request()
         if not can_request:
-            logger.warning(f"DTDD request blocked: {reason}")
+            logger.warning("DTDD request blocked: %s", reason)
             return None
         
         try:
@@ -208,10 +208,10 @@ class DoesTheDogDieClient:
             self._usage_tracker.record_request()
             return response.json()
         except requests.RequestException as e:
-            logger.error(f"DTDD API request failed: {e}")
+            logger.error("DTDD API request failed: %s", e)
             return None
         except ValueError as e:
-            logger.error(f"Failed to parse DTDD response: {e}")
+            logger.error("Failed to parse DTDD response: %s", e)
             return None
     
     def search_movie(self, title: str) -> List[MovieSearchResult]:
@@ -401,7 +401,7 @@ class DoesTheDogDieClient:
                 result = results[0]
         
         if not result:
-            logger.warning(f"No DoesTheDogDie results for: {title}")
+            logger.warning("No DoesTheDogDie results for: %s", title)
             return None
         
         logger.info(f"Found DTDD match: {result.title} ({result.year}) - ID {result.id}")
@@ -43,6 +43,12 @@ SECTION_MAPPING = {
     "advisory-frightening": ContentCategory.FRIGHTENING,
 }
 
+# Patterns used while parsing pages, compiled once at import
+_IMDB_ID_RE = re.compile(r"(tt\d{7,})")
+_PARENTS_GUIDE_SUFFIX_RE = re.compile(r"\s*-?\s*Parents Guide.*$", re.IGNORECASE)
+_YEAR_RE = re.compile(r"(\d{4})")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class IMDbClient:
     """
@@ -95,7 +101,7 @@ class IMDbClient:
             return self._parse_search_results(response.text)
             
         except requests.RequestException as e:
-            logger.error(f"IMDb search failed: {e}")
+            logger.error("IMDb search failed: %s", e)
             return []
     
     def _parse_search_results(self, html: str) -> List[MovieSearchResult]:
@@ -162,7 +168,7 @@ class IMDbClient:
     
     def _extract_imdb_id(self, url_or_path: str) -> Optional[str]:
         """Extract IMDb ID (tt1234567) from URL or path."""
-        match = re.search(r"(tt\d{7,})", url_or_path)
+        match = _IMDB_ID_RE.search(url_or_path)
         return match.group(1) if match else None
     
     def get_parents_guide(self, imdb_id: str) -> Optional[MovieContentInfo]:
@@ -184,7 +190,7 @@ class IMDbClient:
             return self._parse_parents_guide(imdb_id, response.text)
             
         except requests.RequestException as e:
-            logger.error(f"Failed to fetch Parents Guide for {imdb_id}: {e}")
+            logger.error("Failed to fetch Parents Guide for %s: %s", imdb_id, e)
             return None
     
     def _parse_parents_guide(self, imdb_id: str, html: str) -> MovieContentInfo:
@@ -197,14 +203,14 @@ class IMDbClient:
         if title_elem:
             title = title_elem.get_text(strip=True)
             # Clean up title (remove "Parents Guide" suffix if present)
-            title = re.sub(r"\s*-?\s*Parents Guide.*$", "", title, flags=re.IGNORECASE)
+            title = _PARENTS_GUIDE_SUFFIX_RE.sub("", title)
         
         # Extract year
         year = None
         year_elem = soup.select_one(".ipc-inline-list__item a[href*='releaseinfo']")
         if year_elem:
             year_text = year_elem.get_text(strip=True)
-            year_match = re.search(r"(\d{4})", year_text)
+            year_match = _YEAR_RE.search(year_text)
             if year_match:
                 year = year_match.group(1)
         
@@ -278,7 +284,7 @@ class IMDbClient:
                     text = elem.get_text(strip=True)
                     if text and len(text) > 10:  # Filter out short/empty items
                         # Clean up the text
-                        text = re.sub(r"\s+", " ", text)
+                        text = _WHITESPACE_RE.sub(" ", text)
                         descriptions.append(text)
                 break
         
@@ -297,7 +303,7 @@ class IMDbClient:
         """
         results = self.search_movie(title, year)
         if not results:
-            logger.warning(f"No IMDb results found for: {title}")
+            logger.warning("No IMDb results found for: %s", title)
             return None
         
         # Use the first result
@@ -31,13 +31,25 @@ class Severity(Enum):
     @property
     def color(self) -> str:
         """Get display color for severity."""
-        return {
-            Severity.NONE: "#4ade80",      # Green
-            Severity.MILD: "#facc15",      # Yellow
-            Severity.MODERATE: "#fb923c",  # Orange
-            Severity.SEVERE: "#ef4444",    # Red
-            Severity.UNKNOWN: "#9ca3af"    # Gray
-        }.get(self, "#9ca3af")
+        return _SEVERITY_COLORS.get(self, "#9ca3af")
+
+
+# Built once rather than per lookup
+_SEVERITY_COLORS = {
+    Severity.NONE: "#4ade80",      # Green
+    Severity.MILD: "#facc15",      # Yellow
+    Severity.MODERATE: "#fb923c",  # Orange
+    Severity.SEVERE: "#ef4444",    # Red
+    Severity.UNKNOWN: "#9ca3af"    # Gray
+}
+
+# Ordering used by max_severity(); UNKNOWN is deliberately unranked
+_SEVERITY_RANK = {
+    Severity.NONE: 0,
+    Severity.MILD: 1,
+    Severity.MODERATE: 2,
+    Severity.SEVERE: 3,
+}
 
 
 class ContentCategory(Enum):
@@ -211,12 +223,11 @@ class MovieContentInfo:
     @property
     def max_severity(self) -> Severity:
         """Get the highest severity across all categories."""
-        severity_order = [Severity.NONE, Severity.MILD, Severity.MODERATE, Severity.SEVERE]
         max_sev = Severity.NONE
         for warning in self.warnings:
-            if warning.severity in severity_order:
-                if severity_order.index(warning.severity) > severity_order.index(max_sev):
-                    max_sev = warning.severity
+            rank = _SEVERITY_RANK.get(warning.severity)
+            if rank is not None and rank > _SEVERITY_RANK[max_sev]:
+                max_sev = warning.severity
         return max_sev
     
     def summary(self) -> str:
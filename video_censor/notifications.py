@@ -98,13 +98,21 @@ def notify_progress(topic: str, filename: str, progress: int, eta: str) -> bool:
 
 # --- System (OS-level) Notifications ---
 
+def _spawn(cmd: list) -> None:
+    """Start a notifier command without waiting for it to exit."""
+    import subprocess
+    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
 def notify_system(title: str, message: str, sound: bool = True) -> bool:
     """
     Send a native OS notification.
     Works on macOS, Windows, and Linux.
+    
+    The notifier process is started and left to finish on its own, so
+    callers on the UI thread don't wait out osascript/PowerShell start-up.
     """
     import platform
-    import subprocess
     
     system = platform.system()
     
@@ -114,7 +122,7 @@ def notify_system(title: str, message: str, sound: bool = True) -> bool:
             safe_title = title.replace('\\', '\\\\').replace('"', '\\"')
             safe_message = message.replace('\\', '\\\\').replace('"', '\\"')
             script = f'display notification "{safe_message}" with title "{safe_title}" sound name "Glass"'
-            subprocess.run(["osascript", "-e", script], check=False)
+            _spawn(["osascript", "-e", script])
             return True
         elif system == "Windows":
             # Use Windows toast notifications via PowerShell
@@ -130,10 +138,10 @@ def notify_system(title: str, message: str, sound: bool = True) -> bool:
             $notifier = [Windows.UI.Notifications.ToastNotificationManager]::CreateToastNotifier("VideoCensor")
             $notifier.Show([Windows.UI.Notifications.ToastNotification]::new($template))
             '''
-            subprocess.run(["powershell", "-Command", script], check=False)
+            _spawn(["powershell", "-Command", script])
             return True
         else:  # Linux
-            subprocess.run(["notify-send", title, message], check=False)
+            _spawn(["notify-send", title, message])
             return True
     except Exception as e:
         print(f"Failed to send system notification: {e}")
@@ -43,7 +43,8 @@ class Notifier:
         safe_title = title.replace('\\', '\\\\').replace('"', '\\"')
         safe_message = message.replace('\\', '\\\\').replace('"', '\\"')
         script = f'display notification "{safe_message}" with title "{safe_title}" subtitle "Video Censor"'
-        subprocess.run(["osascript", "-e", script], check=False)
+        # Fire and forget: don't hold the caller up for osascript's start-up
+        subprocess.Popen(["osascript", "-e", script], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     def _send_ntfy_notification(self, title: str, message: str, priority: str):
         """Send notification via ntfy.sh."""
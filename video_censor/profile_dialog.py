@@ -5,13 +5,21 @@ Provides a Toplevel window for managing named filter profiles
 with full CRUD operations.
 """
 
+import os
+import shutil
+import subprocess
+import sys
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk, messagebox
 from typing import Callable, Optional
 
 from .preferences import ContentFilterSettings, Profile
 from .profile_manager import ProfileManager
 
+CUSTOM_PHRASES_DIR = Path.home() / ".video_censor"
+CUSTOM_PHRASES_FILE = CUSTOM_PHRASES_DIR / "custom_phrases.txt"
+
 
 class ProfileDialog(tk.Toplevel):
     """
@@ -58,13 +66,19 @@ class ProfileDialog(tk.Toplevel):
     
     def _create_ui(self) -> None:
         """Build the dialog UI."""
-        # Configure styles
-        style = ttk.Style()
-        style.configure("Dark.TFrame", background=self.bg_color)
-        style.configure("Panel.TFrame", background=self.panel_bg)
-        style.configure("Dark.TLabel", background=self.bg_color, foreground=self.fg_color)
-        style.configure("Panel.TLabel", background=self.panel_bg, foreground=self.fg_color)
-        style.configure("Muted.TLabel", background=self.panel_bg, foreground=self.muted_color)
+        # Configure styles. They are global to the Tk interpreter, so after
+        # the first dialog a single lookup shows they're already in place.
+        style = ttk.Style(self)
+        if style.lookup("Muted.TLabel", "foreground") != self.muted_color:
+            style_spec = {
+                "Dark.TFrame": {"background": self.bg_color},
+                "Panel.TFrame": {"background": self.panel_bg},
+                "Dark.TLabel": {"background": self.bg_color, "foreground": self.fg_color},
+                "Panel.TLabel": {"background": self.panel_bg, "foreground": self.fg_color},
+                "Muted.TLabel": {"background": self.panel_bg, "foreground": self.muted_color},
+            }
+            for name, options in style_spec.items():
+                style.configure(name, **options)
         
         # Main container
         main_frame = tk.Frame(self, bg=self.bg_color, padx=20, pady=20)
@@ -190,7 +204,7 @@ class ProfileDialog(tk.Toplevel):
             highlightbackground=self.border_color
         )
         self.name_entry.pack(fill=tk.X, pady=(5, 15))
-        self.name_entry.bind("<KeyRelease>", lambda e: self._mark_unsaved())
+        self.name_entry.bind("<KeyRelease>", self._mark_unsaved)
         
         # Description
         tk.Label(
@@ -212,7 +226,7 @@ class ProfileDialog(tk.Toplevel):
             highlightbackground=self.border_color
         )
         self.desc_entry.pack(fill=tk.X, pady=(5, 20))
-        self.desc_entry.bind("<KeyRelease>", lambda e: self._mark_unsaved())
+        self.desc_entry.bind("<KeyRelease>", self._mark_unsaved)
         
         # Filter settings section
         tk.Label(
@@ -475,9 +489,6 @@ class ProfileDialog(tk.Toplevel):
     
     def _create_custom_phrases_section(self, parent: tk.Frame) -> None:
         """Create the collapsible custom phrases section."""
-        import subprocess
-        from pathlib import Path
-        
         # Container for the collapsible section
         self.phrases_container = tk.Frame(parent, bg=self.panel_bg)
         self.phrases_container.pack(fill=tk.X, pady=(15, 0))
@@ -508,10 +519,16 @@ class ProfileDialog(tk.Toplevel):
         header_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Bind click to toggle
-        self.phrases_chevron.bind("<Button-1>", lambda e: self._toggle_custom_phrases())
-        header_label.bind("<Button-1>", lambda e: self._toggle_custom_phrases())
+        for widget in (self.phrases_chevron, header_label):
+            widget.bind("<Button-1>", self._toggle_custom_phrases)
         
-        # Expandable content frame (initially hidden)
+        # The content (text box, links) is built on first expand; phrases
+        # set before then are held here
+        self.phrases_content = None
+        self._pending_phrases: list = []
+    
+    def _build_phrases_content(self) -> None:
+        """Build the expandable custom phrases content frame."""
         self.phrases_content = tk.Frame(self.phrases_container, bg=self.panel_bg)
         
         # Multi-line text box (4-6 lines)
@@ -539,7 +556,13 @@ class ProfileDialog(tk.Toplevel):
         # Bind focus events for placeholder behavior
         self.phrases_text.bind("<FocusIn>", self._on_phrases_focus_in)
         self.phrases_text.bind("<FocusOut>", self._on_phrases_focus_out)
-        self.phrases_text.bind("<Key>", lambda e: self._mark_unsaved())
+        self.phrases_text.bind("<Key>", self._mark_unsaved)
+        
+        # Parsed phrases are cached; <<Modified>> marks them stale
+        self._phrases_cache: list = []
+        self._phrases_dirty = True
+        self.phrases_text.bind("<<Modified>>", self._on_phrases_modified)
+        self.phrases_text.edit_modified(False)
         
         # Links/buttons row
         links_frame = tk.Frame(self.phrases_content, bg=self.panel_bg)
@@ -555,7 +578,7 @@ class ProfileDialog(tk.Toplevel):
             cursor="hand2"
         )
         self.open_file_link.pack(side=tk.LEFT)
-        self.open_file_link.bind("<Button-1>", lambda e: self._open_custom_phrases_file())
+        self.open_file_link.bind("<Button-1>", self._open_custom_phrases_file)
         
         # "Paste full movie transcript" button (disabled for now)
         self.transcript_btn = tk.Button(
@@ -572,8 +595,12 @@ class ProfileDialog(tk.Toplevel):
         )
         self.transcript_btn.pack(side=tk.RIGHT)
     
-    def _toggle_custom_phrases(self) -> None:
-        """Toggle the custom phrases section visibility."""
+    def _toggle_custom_phrases(self, event=None) -> None:
+        """Toggle the custom phrases section visibility (also a click handler)."""
+        if self.phrases_content is None:
+            self._build_phrases_content()
+            self._set_custom_phrases(self._pending_phrases)
+        
         if self.phrases_expanded:
             self.phrases_content.pack_forget()
             self.phrases_chevron.config(text="▶")
@@ -601,18 +628,33 @@ class ProfileDialog(tk.Toplevel):
         if not content:
             self._set_phrases_placeholder()
     
+    def _on_phrases_modified(self, event) -> None:
+        """Mark the cached phrases stale when the text box changes."""
+        self._phrases_dirty = True
+        # Reset the flag so the next edit fires <<Modified>> again
+        self.phrases_text.edit_modified(False)
+    
     def _get_custom_phrases(self) -> list:
         """Get list of custom phrases from text box."""
+        if self.phrases_content is None:
+            return list(self._pending_phrases)
         if self._phrases_has_placeholder:
             return []
+        if not self._phrases_dirty:
+            return list(self._phrases_cache)
+        
         content = self.phrases_text.get("1.0", tk.END).strip()
-        if not content:
-            return []
         # Split by newlines and filter empty lines
-        return [line.strip() for line in content.split("\n") if line.strip()]
+        self._phrases_cache = [line.strip() for line in content.split("\n") if line.strip()]
+        self._phrases_dirty = False
+        return list(self._phrases_cache)
     
     def _set_custom_phrases(self, phrases: list) -> None:
         """Set custom phrases in text box."""
+        if self.phrases_content is None:
+            self._pending_phrases = list(phrases)
+            return
+        self._phrases_dirty = True
         self.phrases_text.delete("1.0", tk.END)
         if phrases:
             self.phrases_text.insert("1.0", "\n".join(phrases))
@@ -621,24 +663,23 @@ class ProfileDialog(tk.Toplevel):
         else:
             self._set_phrases_placeholder()
     
-    def _open_custom_phrases_file(self) -> None:
-        """Open the custom phrases file in the default editor."""
-        import subprocess
-        from pathlib import Path
-        
-        # Ensure directory exists
-        phrases_dir = Path.home() / ".video_censor"
-        phrases_dir.mkdir(exist_ok=True)
-        
-        phrases_file = phrases_dir / "custom_phrases.txt"
-        
-        # Create file if it doesn't exist
-        if not phrases_file.exists():
-            phrases_file.write_text("# Custom phrases to mute or cut\n# One phrase per line\n\n")
-        
-        # Open in default editor
+    def _open_custom_phrases_file(self, event=None) -> None:
+        """Open the custom phrases file in the default editor (also a click handler)."""
+        # Only touch the filesystem when the directory/file are missing
+        if not CUSTOM_PHRASES_FILE.exists():
+            if not CUSTOM_PHRASES_DIR.exists():
+                CUSTOM_PHRASES_DIR.mkdir(parents=True)
+            CUSTOM_PHRASES_FILE.write_text("# Custom phrases to mute or cut\n# One phrase per line\n\n")
+        
+        # Launch without waiting for the editor/launcher to return
         try:
-            subprocess.run(["open", str(phrases_file)], check=True)
+            if sys.platform == "win32":
+                os.startfile(str(CUSTOM_PHRASES_FILE))
+                return
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            if shutil.which(opener) is None:
+                raise FileNotFoundError(f"'{opener}' not found")
+            subprocess.Popen([opener, str(CUSTOM_PHRASES_FILE)])
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}")
     
@@ -719,8 +760,8 @@ class ProfileDialog(tk.Toplevel):
             censor_subtitle_profanity=self.var_censor_subtitles.get()
         )
     
-    def _mark_unsaved(self) -> None:
-        """Mark that there are unsaved changes."""
+    def _mark_unsaved(self, event=None) -> None:
+        """Mark that there are unsaved changes (also a key handler)."""
         self._unsaved_changes = True
         self._update_status("Unsaved changes")
     
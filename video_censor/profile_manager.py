@@ -8,7 +8,7 @@ content filter profiles stored in ~/.video_censor/profiles.json.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .preferences import Profile, ContentFilterSettings, DEFAULT_PROFILES
 
@@ -30,6 +30,7 @@ class ProfileManager:
     def __init__(self):
         """Initialize the profile manager and load profiles from disk."""
         self._profiles: Dict[str, Profile] = {}
+        self._names_cache: Optional[Tuple[str, ...]] = None
         self._ensure_app_dir()
         self.load()
     
@@ -48,6 +49,7 @@ class ProfileManager:
                 (p for p in DEFAULT_PROFILES if p.name == "Default"),
                 Profile(name="Default", settings=ContentFilterSettings())
             )
+            self._names_cache = None
             self._profiles["Default"] = Profile(
                 name=default.name,
                 description=default.description,
@@ -75,6 +77,7 @@ class ProfileManager:
             # Load profiles
             profiles_data = data.get("profiles", [])
             self._profiles = {}
+            self._names_cache = None
             for profile_data in profiles_data:
                 try:
                     profile = Profile.from_dict(profile_data)
@@ -97,6 +100,7 @@ class ProfileManager:
     def _initialize_defaults(self) -> None:
         """Initialize with default profiles."""
         self._profiles = {}
+        self._names_cache = None
         for default_profile in DEFAULT_PROFILES:
             self._profiles[default_profile.name] = Profile(
                 name=default_profile.name,
@@ -137,9 +141,15 @@ class ProfileManager:
         profiles.sort(key=lambda p: (0 if p.name == "Default" else 1, p.name))
         return profiles
     
-    def list_names(self) -> List[str]:
-        """Get all profile names, with Default first."""
-        return [p.name for p in self.list_profiles()]
+    def list_names(self) -> Tuple[str, ...]:
+        """
+        Get all profile names, with Default first.
+        
+        The result is cached until profiles are added, renamed or removed.
+        """
+        if self._names_cache is None:
+            self._names_cache = tuple(p.name for p in self.list_profiles())
+        return self._names_cache
     
     def list_all(self) -> List[Profile]:
         """Alias for list_profiles for API compatibility."""
@@ -153,6 +163,7 @@ class ProfileManager:
             raise ValueError("Profile name cannot be empty")
         
         self._profiles[profile.name] = profile
+        self._names_cache = None
         self.save()
         logger.info(f"Added profile: {profile.name}")
     
@@ -172,6 +183,7 @@ class ProfileManager:
             if name == "Default":
                 raise ValueError("Cannot rename the Default profile")
             del self._profiles[name]
+            self._names_cache = None
         
         self._profiles[profile.name] = profile
         self.save()
@@ -185,6 +197,7 @@ class ProfileManager:
             raise ValueError(f"Profile '{name}' not found")
         
         del self._profiles[name]
+        self._names_cache = None
         self.save()
         logger.info(f"Deleted profile: {name}")
     
@@ -208,6 +221,7 @@ class ProfileManager:
             settings=source.settings.copy()
         )
         self._profiles[new_name] = new_profile
+        self._names_cache = None
         self.save()
         logger.info(f"Duplicated profile: {source_name} -> {new_name}")
         return new_profile
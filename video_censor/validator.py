@@ -14,10 +14,10 @@ from typing import Optional, Tuple
 logger = logging.getLogger(__name__)
 
 # Supported video formats (by extension)
-SUPPORTED_FORMATS = {
+SUPPORTED_FORMATS = frozenset({
     '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
     '.m4v', '.mpeg', '.mpg', '.3gp', '.ts', '.mts'
-}
+})
 
 
 @dataclass
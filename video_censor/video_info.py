@@ -107,11 +107,12 @@ def _format_duration(seconds: float) -> str:
         return f"{minutes}:{secs:02d}"
 
 
+# (suffix, divisor) per power of 1024; the index is floor(log2(size)) // 10
+_SIZE_UNITS = tuple((unit, 1 << (10 * i)) for i, unit in enumerate(("B", "KB", "MB", "GB", "TB", "PB")))
+
+
 def _format_size(bytes_size: int) -> str:
     """Format bytes as human readable size."""
-    size = float(bytes_size)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    size = int(bytes_size)
+    unit, divisor = _SIZE_UNITS[min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)]
+    return f"{size / divisor:.1f} {unit}"
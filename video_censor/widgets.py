@@ -4,10 +4,141 @@ Custom Modern Widgets for Video Censor GUI
 Premium UI components including toggle switches and gradient progress bars.
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional, Tuple
 
+def _row_fonts(widget: tk.Misc) -> tuple:
+    """
+    Shared (label, badge) fonts for ModernFilterRow, created once per Tk root.
+    
+    A Font belongs to the interpreter it was made in, so the fonts are kept
+    on the root: a later Tk() gets its own rather than ones that died with
+    the first.
+    """
+    root = widget._root()
+    fonts = getattr(root, "_filter_row_fonts", None)
+    if fonts is None:
+        from tkinter.font import Font
+        fonts = (
+            Font(root=root, family="SF Pro Display", size=12),
+            Font(root=root, family="SF Pro Display", size=9),
+        )
+        root._filter_row_fonts = fonts
+    return fonts
+
+
+def _rounded_rect_points(x1: int, y1: int, x2: int, y2: int, r: int) -> list:
+    """
+    Control points for a rounded rectangle drawn as one smoothed polygon.
+    
+    Corner points are doubled so the spline stays straight along the edges.
+    """
+    return [
+        x1 + r, y1, x1 + r, y1,
+        x2 - r, y1, x2 - r, y1,
+        x2, y1,
+        x2, y1 + r, x2, y1 + r,
+        x2, y2 - r, x2, y2 - r,
+        x2, y2,
+        x2 - r, y2, x2 - r, y2,
+        x1 + r, y2, x1 + r, y2,
+        x1, y2,
+        x1, y2 - r, x1, y2 - r,
+        x1, y1 + r, x1, y1 + r,
+        x1, y1,
+    ]
+
+
+@functools.lru_cache(maxsize=32)
+def _gradient_colors(start: str, end: str, steps: int) -> Tuple[str, ...]:
+    """
+    Hex colors for a `steps`-pixel gradient from `start` to `end`.
+    
+    Cached so progress redraws at a width already seen skip the per-pixel
+    color interpolation.
+    """
+    rgb1 = tuple(int(start[i:i+2], 16) for i in (1, 3, 5))
+    rgb2 = tuple(int(end[i:i+2], 16) for i in (1, 3, 5))
+    colors = []
+    for i in range(steps):
+        t = i / max(1, steps - 1) if steps > 1 else 0
+        colors.append("#%02x%02x%02x" % tuple(int(rgb1[c] + (rgb2[c] - rgb1[c]) * t) for c in range(3)))
+    return tuple(colors)
+
+
+class _AnimScheduler:
+    """
+    Shared frame ticker for widget animations.
+    
+    All in-flight animations advance on the same tick and Tk flushes the
+    resulting redraws once per frame instead of once per widget.
+    """
+    
+    FRAME_MS = 16
+    
+    def __init__(self):
+        self._callbacks = {}  # callback -> widget that owns it
+        self._after_id = None
+        self._owner = None  # Widget the pending tick is scheduled on
+    
+    def register(self, widget: tk.Misc, callback: Callable[[], None]) -> None:
+        """Call `callback` once per frame until it is unregistered."""
+        self._callbacks[callback] = widget
+        if not self._tick_pending():
+            self._schedule(widget)
+    
+    def unregister(self, callback: Callable[[], None]) -> None:
+        """Stop calling `callback`."""
+        self._callbacks.pop(callback, None)
+    
+    def _schedule(self, widget: tk.Misc) -> bool:
+        # Ticks go on the Tk root rather than the animating widget, which
+        # may be destroyed while the tick is pending (cancelling it)
+        try:
+            root = widget._root()
+            self._after_id = root.after(self.FRAME_MS, self._tick)
+            self._owner = root
+            return True
+        except tk.TclError:
+            self._after_id = None
+            self._owner = None
+            return False
+    
+    def _tick_pending(self) -> bool:
+        if self._after_id is None:
+            return False
+        try:
+            return bool(self._owner.winfo_exists())
+        except tk.TclError:
+            # Owner went away with the tick still queued; it will never run
+            self._after_id = None
+            self._owner = None
+            return False
+    
+    def _tick(self) -> None:
+        self._after_id = None
+        self._owner = None
+        
+        for callback, widget in list(self._callbacks.items()):
+            try:
+                callback()
+            except tk.TclError:
+                # Widget was destroyed mid-animation
+                self.unregister(callback)
+        
+        for widget in list(self._callbacks.values()):
+            try:
+                widget.update_idletasks()
+            except tk.TclError:
+                continue
+            if self._schedule(widget):
+                break
+
+
+_ANIM_SCHEDULER = _AnimScheduler()
+
 
 class ModernToggle(tk.Canvas):
     """
@@ -47,6 +178,7 @@ class ModernToggle(tk.Canvas):
         # State
         self.variable = variable or tk.BooleanVar(value=False)
         self._value = self.variable.get()
+        self._suppress_trace = False
         
         # Animation state
         self._animating = False
@@ -77,10 +209,15 @@ class ModernToggle(tk.Canvas):
         # Determine colors based on state
         bg_color = self.on_color if self._value else self.off_color
         
-        # Draw rounded track
-        self.create_oval(0, 0, h, h, fill=bg_color, outline="", tags="track")
-        self.create_oval(w - h, 0, w, h, fill=bg_color, outline="", tags="track")
-        self.create_rectangle(r, 0, w - r, h, fill=bg_color, outline="", tags="track")
+        # Draw rounded track as a single canvas item
+        self._track = self.create_polygon(
+            _rounded_rect_points(0, 0, w, h, r),
+            smooth=True,
+            splinesteps=12,
+            fill=bg_color,
+            outline="",
+            tags="track"
+        )
         
         # Calculate knob position
         if self._value:
@@ -118,7 +255,13 @@ class ModernToggle(tk.Canvas):
     def _on_click(self, event) -> None:
         """Handle click to toggle."""
         self._value = not self._value
-        self.variable.set(self._value)
+        
+        # Our own write doesn't need to round-trip through the trace
+        self._suppress_trace = True
+        try:
+            self.variable.set(self._value)
+        finally:
+            self._suppress_trace = False
         self._animate_toggle()
         
         if self.command:
@@ -126,6 +269,8 @@ class ModernToggle(tk.Canvas):
     
     def _on_variable_change(self, *args) -> None:
         """Handle external variable changes."""
+        if self._suppress_trace:
+            return
         new_value = self.variable.get()
         if new_value != self._value:
             self._value = new_value
@@ -143,11 +288,12 @@ class ModernToggle(tk.Canvas):
         self._current_x = start_x
         self._target_x = end_x
         self._animating = True
-        self._animate_step()
+        _ANIM_SCHEDULER.register(self, self._animate_step)
     
     def _animate_step(self) -> None:
-        """Single animation frame."""
+        """Single animation frame, driven by the shared scheduler."""
         if not self._animating:
+            _ANIM_SCHEDULER.unregister(self._animate_step)
             return
         
         # Ease towards target
@@ -160,8 +306,8 @@ class ModernToggle(tk.Canvas):
         
         self._draw()
         
-        if self._animating:
-            self.after(10, self._animate_step)
+        if not self._animating:
+            _ANIM_SCHEDULER.unregister(self._animate_step)
     
     def _on_enter(self, event) -> None:
         """Hover effect."""
@@ -177,6 +323,8 @@ class ModernToggle(tk.Canvas):
     
     def set(self, value: bool) -> None:
         """Set value externally."""
+        if bool(value) == self._value:
+            return
         self.variable.set(value)
 
 
@@ -214,6 +362,10 @@ class GradientProgressBar(tk.Canvas):
         self.track_color = bg_color
         self._value = min(max(value, 0.0), 1.0)
         
+        # Track never changes, so it is drawn once and kept
+        self._track_id = self._draw_rounded_rect(
+            0, 0, width, height, height // 2, self.track_color, "track"
+        )
         self._draw()
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
@@ -234,27 +386,23 @@ class GradientProgressBar(tk.Canvas):
         return self._rgb_to_hex(rgb)
     
     def _draw(self) -> None:
-        """Draw the progress bar."""
-        self.delete("all")
+        """Draw the progress fill over the persistent track."""
+        self.delete("fill", "fill_cap")
         
         w = self.bar_width
         h = self.bar_height
         r = h // 2
         
-        # Draw track (rounded rectangle)
-        self._draw_rounded_rect(0, 0, w, h, r, self.track_color, "track")
-        
         # Calculate fill width
         fill_width = max(h, int(w * self._value))  # Minimum width = height for rounded look
         
         if self._value > 0:
             # Draw gradient fill using multiple thin rectangles
             steps = max(1, fill_width - h)  # Subtract diameter for proper sizing
+            colors = _gradient_colors(self.gradient_start, self.gradient_end, steps)
             
-            for i in range(steps):
+            for i, color in enumerate(colors):
                 x = r + i
-                t = i / max(1, steps - 1) if steps > 1 else 0
-                color = self._interpolate_color(self.gradient_start, self.gradient_end, t)
                 self.create_line(x, 1, x, h - 1, fill=color, tags="fill")
             
             # Draw rounded caps
@@ -278,15 +426,27 @@ class GradientProgressBar(tk.Canvas):
         r: int, 
         fill: str, 
         tags: str
-    ) -> None:
-        """Draw a rounded rectangle."""
-        self.create_oval(x1, y1, x1 + 2*r, y2, fill=fill, outline="", tags=tags)
-        self.create_oval(x2 - 2*r, y1, x2, y2, fill=fill, outline="", tags=tags)
-        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=fill, outline="", tags=tags)
+    ) -> int:
+        """Draw a rounded rectangle as one smoothed polygon and return its ID."""
+        return self.create_polygon(
+            _rounded_rect_points(x1, y1, x2, y2, r),
+            smooth=True,
+            splinesteps=12,
+            fill=fill,
+            outline="",
+            tags=tags
+        )
     
     def set_value(self, value: float) -> None:
         """Set progress value (0.0 to 1.0)."""
-        self._value = min(max(value, 0.0), 1.0)
+        new_value = min(max(value, 0.0), 1.0)
+        old_value = self._value
+        self._value = new_value
+        
+        # Sub-pixel changes aren't visible, so skip the repaint
+        w = self.bar_width
+        if int(w * new_value) == int(w * old_value) and (new_value > 0) == (old_value > 0):
+            return
         self._draw()
     
     def get_value(self) -> float:
@@ -314,6 +474,8 @@ class ModernFilterRow(tk.Frame):
     ):
         super().__init__(parent, bg=bg_color, **kwargs)
         
+        row_font, badge_font = _row_fonts(self)
+        
         self.variable = variable
         self.disabled = disabled
         
@@ -325,7 +487,7 @@ class ModernFilterRow(tk.Frame):
         self.label = tk.Label(
             self,
             text=display_text,
-            font=("SF Pro Display", 12),
+            font=row_font,
             bg=bg_color,
             fg="#666666" if disabled else fg_color,
             anchor="w"
@@ -347,7 +509,7 @@ class ModernFilterRow(tk.Frame):
             badge = tk.Label(
                 self,
                 text="Soon",
-                font=("SF Pro Display", 9),
+                font=badge_font,
                 bg="#2a2a35",
                 fg="#666666",
                 padx=6,
@@ -387,15 +549,17 @@ class StatusDot(tk.Canvas):
         
         self.size = size
         self._status = status
-        self._draw()
-    
-    def _draw(self) -> None:
-        """Draw the status dot."""
-        self.delete("all")
-        color = self.STATUS_COLORS.get(self._status, "#666666")
-        self.create_oval(0, 0, self.size, self.size, fill=color, outline="")
+        
+        # Drawn once; status changes only recolor it
+        self._dot = self.create_oval(
+            0, 0, size, size,
+            fill=self.STATUS_COLORS.get(status, "#666666"),
+            outline=""
+        )
     
     def set_status(self, status: str) -> None:
         """Update status."""
+        if status == self._status:
+            return
         self._status = status
-        self._draw()
+        self.itemconfig(self._dot, fill=self.STATUS_COLORS.get(status, "#666666"))